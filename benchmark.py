@@ -0,0 +1,220 @@
+import argparse
+import json
+import os
+import platform
+import random
+import shutil
+import subprocess
+import sys
+import tempfile
+import time
+
+# Benchmark compile.py against synthetic portfolios of growing size.
+#
+# Each size gets a scratch copy of the compiler and template plus generated
+# data/*.json and details/**/*.md. The compiler runs three times per size:
+#   cold  - empty build cache, every output rebuilt
+#   noop  - nothing changed, should stop after the manifest check
+#   edit  - one project summary changed, one card re-rendered
+# Results (wall time, peak RSS, per-phase breakdown from --timings) are
+# written as JSON so runs from different commits can be diffed, together
+# with the cold start cost: a bare interpreter versus one that imports
+# compile.py.
+
+BASE_DIR = os.path.dirname(os.path.abspath(__file__))
+DEFAULT_SIZES = [10, 100, 1000, 10000]
+STARTUP_RUNS = 5
+
+WORDS = (
+    "model data agent pipeline research system network training inference "
+    "latency cache browser render compile vector search graph query stream "
+    "python javascript rust api server client dataset benchmark accuracy "
+    "deploy container cluster embedding transformer retrieval evaluation"
+).split()
+
+TECH = ["Python", "FastAPI", "PyTorch", "React", "Node.js", "Docker", "Rust", "SQL", "LangChain", "Redis"]
+
+
+def sentence(rng, words=12):
+    text = ' '.join(rng.choice(WORDS) for _ in range(words))
+    return text.capitalize() + '.'
+
+
+def paragraph(rng, sentences=4):
+    return ' '.join(sentence(rng, rng.randint(8, 16)) for _ in range(sentences))
+
+
+def detail_markdown(rng, title):
+    parts = [f"# {title}", "", paragraph(rng), "", "## Features", ""]
+    parts += [f"- **{rng.choice(WORDS).capitalize()}**: {sentence(rng)}" for _ in range(6)]
+    parts += ["", "## How it works", "", paragraph(rng, 6), "", "```python", "def main():", "    return 42", "```", ""]
+    return '\n'.join(parts)
+
+
+def generate_site(root, size, seed=0):
+    rng = random.Random(seed)
+    data_dir = os.path.join(root, 'data')
+    os.makedirs(data_dir)
+    os.makedirs(os.path.join(root, 'details', 'projects'))
+    os.makedirs(os.path.join(root, 'details', 'achievements'))
+
+    # Sections that do not scale with the corpus keep the real data
+    for name in ('about', 'techstack', 'experience', 'education', 'certifications'):
+        shutil.copy(os.path.join(BASE_DIR, 'data', f'{name}.json'), data_dir)
+
+    projects = []
+    achievements = []
+    research = []
+    for i in range(size):
+        title = f"Project {i} {rng.choice(WORDS).capitalize()}"
+        detail = f"details/projects/proj-{i}.md"
+        with open(os.path.join(root, detail), 'w', encoding='utf-8') as f:
+            f.write(detail_markdown(rng, title))
+        projects.append({
+            'id': f'proj-{i}',
+            'title': title,
+            'tech': rng.sample(TECH, 4),
+            'summary': f"A **{rng.choice(WORDS)}** tool. {paragraph(rng, 2)}",
+            'detail': detail,
+            'links': {'github': f'https://github.com/example/project-{i}'}
+        })
+
+        title = f"Achievement {i}"
+        detail = f"details/achievements/ach-{i}.md"
+        with open(os.path.join(root, detail), 'w', encoding='utf-8') as f:
+            f.write(detail_markdown(rng, title))
+        achievements.append({
+            'id': f'ach-{i}',
+            'title': title,
+            'date': f"2024-{rng.randint(1, 12):02d}-{rng.randint(1, 28):02d}",
+            'summary': paragraph(rng, 2),
+            'detail': detail
+        })
+
+        research.append({
+            'id': f'research-{i}',
+            'title': f"On {rng.choice(WORDS)} {rng.choice(WORDS)} ({i})",
+            'publisher': 'IEEE',
+            'year': str(2015 + i % 10),
+            'summary': paragraph(rng, 2),
+            'doi': f'10.0000/example.{i}'
+        })
+
+    for name, items in (('projects', projects), ('achievements', achievements), ('research', research)):
+        with open(os.path.join(data_dir, f'{name}.json'), 'w', encoding='utf-8') as f:
+            json.dump(items, f, indent=2)
+
+    shutil.copy(os.path.join(BASE_DIR, 'compile.py'), root)
+    shutil.copy(os.path.join(BASE_DIR, 'index-dynamic.html'), root)
+
+
+# Run the compiler once, returning wall time, peak RSS and its phase timings
+def run_compiler(root, extra_args):
+    timings_path = os.path.join(root, 'timings.json')
+    if os.path.exists(timings_path):
+        os.remove(timings_path)
+
+    cmd = [sys.executable, 'compile.py', '--timings', timings_path] + extra_args
+    start = time.perf_counter()
+    proc = subprocess.Popen(cmd, cwd=root, stdout=subprocess.DEVNULL, stderr=subprocess.PIPE)
+    stderr = proc.stderr.read()
+    _, status, rusage = os.wait4(proc.pid, 0)
+    wall = time.perf_counter() - start
+    proc.returncode = os.waitstatus_to_exitcode(status)
+    if proc.returncode != 0:
+        raise RuntimeError(f"compile.py failed in {root}:\n{stderr.decode('utf-8', 'replace')}")
+
+    with open(timings_path, 'r', encoding='utf-8') as f:
+        timings = json.load(f)
+
+    # ru_maxrss is in KiB on Linux and bytes on macOS
+    peak_rss = rusage.ru_maxrss * (1 if sys.platform == 'darwin' else 1024)
+    return {'wall_s': round(wall, 4), 'peak_rss_bytes': peak_rss, **timings}
+
+
+# Best of STARTUP_RUNS, so one slow run (disk cache, scheduler) does not skew it
+def best_wall_time(cmd, cwd):
+    best = None
+    for _ in range(STARTUP_RUNS):
+        start = time.perf_counter()
+        subprocess.run(cmd, cwd=cwd, check=True, stdout=subprocess.DEVNULL)
+        wall = time.perf_counter() - start
+        best = wall if best is None else min(best, wall)
+    return round(best, 4)
+
+
+def measure_startup():
+    interpreter = best_wall_time([sys.executable, '-c', 'pass'], BASE_DIR)
+    module = best_wall_time([sys.executable, '-c', 'import compile'], BASE_DIR)
+    return {'interpreter_s': interpreter, 'import_s': module, 'import_overhead_s': round(module - interpreter, 4)}
+
+
+def edit_one_project(root):
+    path = os.path.join(root, 'data', 'projects.json')
+    with open(path, 'r', encoding='utf-8') as f:
+        projects = json.load(f)
+    projects[len(projects) // 2]['summary'] += ' Edited.'
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(projects, f, indent=2)
+
+
+def git_revision():
+    try:
+        return subprocess.check_output(['git', 'rev-parse', 'HEAD'], cwd=BASE_DIR, text=True).strip()
+    except (OSError, subprocess.CalledProcessError):
+        return None
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Benchmark compile.py on synthetic portfolios.')
+    parser.add_argument('--sizes', type=int, nargs='+', default=DEFAULT_SIZES,
+                        help='number of projects, achievements and research items per run')
+    parser.add_argument('-o', '--output', help='write the JSON report here instead of stdout')
+    parser.add_argument('--keep', action='store_true', help='keep the generated sites')
+    parser.add_argument('compile_args', nargs=argparse.REMAINDER,
+                        help='extra arguments for compile.py, after --')
+    args = parser.parse_args()
+    compile_args = [arg for arg in args.compile_args if arg != '--']
+
+    report = {
+        'revision': git_revision(),
+        'python': platform.python_version(),
+        'platform': platform.platform(),
+        'cpus': os.cpu_count(),
+        'compile_args': compile_args,
+        'startup': measure_startup(),
+        'results': []
+    }
+    print(f"startup: interpreter {report['startup']['interpreter_s']}s, "
+          f"import compile {report['startup']['import_s']}s", file=sys.stderr)
+
+    for size in args.sizes:
+        root = tempfile.mkdtemp(prefix=f'portfolio-bench-{size}-')
+        try:
+            generate_site(root, size)
+            result = {'size': size}
+            result['cold'] = run_compiler(root, compile_args)
+            result['noop'] = run_compiler(root, compile_args)
+            edit_one_project(root)
+            result['edit'] = run_compiler(root, compile_args)
+            result['index_bytes'] = os.path.getsize(os.path.join(root, 'index.html'))
+            report['results'].append(result)
+            print(f"size={size}: cold {result['cold']['wall_s']}s, noop {result['noop']['wall_s']}s, "
+                  f"edit {result['edit']['wall_s']}s, peak RSS {result['cold']['peak_rss_bytes'] // 1024} KiB",
+                  file=sys.stderr)
+        finally:
+            if args.keep:
+                print(f"Kept {root}", file=sys.stderr)
+            else:
+                shutil.rmtree(root, ignore_errors=True)
+
+    output = json.dumps(report, indent=2)
+    if args.output:
+        with open(args.output, 'w', encoding='utf-8') as f:
+            f.write(output + '\n')
+    else:
+        print(output)
+
+
+if __name__ == '__main__':
+    main()
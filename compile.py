@@ -1,476 +1,810 @@
+import argparse
+import glob
+import gzip
+import hashlib
+import importlib.util
 import json
 import os
-import markdown
-import pytz
-from bs4 import BeautifulSoup
-from datetime import datetime
+import re
+import select
+import tempfile
+import threading
+import time
+import traceback
+from collections import Counter
+from contextlib import contextmanager
+from datetime import datetime, timedelta, timezone
+from html import unescape
+
+# Optional: .br files are only written when the brotli package is installed
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+# markdown, bs4, orjson, Pillow, cProfile, concurrent.futures, http.server and
+# ctypes are imported inside the functions that need them. Interpreter and
+# library startup dominates small builds, and a no-op build needs none of
+# them.
 
 # Paths
 BASE_DIR = os.path.dirname(os.path.abspath(__file__))
 DATA_DIR = os.path.join(BASE_DIR, 'data')
+DETAILS_DIR = os.path.join(BASE_DIR, 'details')
+IMAGES_DIR = os.path.join(BASE_DIR, 'images')
+CSS_DIR = os.path.join(BASE_DIR, 'css')
+JS_DIR = os.path.join(BASE_DIR, 'js')
 TEMPLATE_FILE = os.path.join(BASE_DIR, 'index-dynamic.html')
 OUTPUT_FILE = os.path.join(BASE_DIR, 'index.html')
+SITEMAP_FILE = os.path.join(BASE_DIR, 'sitemap.xml')
+LLMS_FILE = os.path.join(BASE_DIR, 'llms.txt')
+SEARCH_INDEX_FILE = os.path.join(BASE_DIR, 'search-index.json')
+
+# Build cache (kept out of git, CI can persist it between runs)
+CACHE_DIR = os.path.join(BASE_DIR, '.build-cache')
+MANIFEST_FILE = os.path.join(CACHE_DIR, 'manifest.json')
+FRAGMENT_DIR = os.path.join(CACHE_DIR, 'fragments')
+MANIFEST_VERSION = 1
+
+# Block size used when streaming cached fragments into the output
+STREAM_BLOCK_SIZE = 64 * 1024
+
+base_url = "https://dinesh-kumar-e.github.io/"
+
+# Data files each output depends on, in addition to the compiler itself.
+# index.html also depends on the template and every detail file.
+SITEMAP_DATA = ['about', 'projects', 'research', 'achievements', 'certifications']
+LLMS_DATA = ['about', 'projects', 'research', 'achievements', 'experience', 'education', 'certifications', 'techstack']
+SEARCH_DATA = ['projects', 'research', 'achievements', 'certifications']
+
+# --static-pages: paginated sections get <section>/ and <section>/page/N/,
+# the ones in PERMALINK_SECTIONS also get <section>/<id>/ per item
+STATIC_PAGE_SECTIONS = {
+    'projects': 'Projects', 'research': 'Research',
+    'achievements': 'Achievements', 'certifications': 'Certifications'
+}
+PERMALINK_SECTIONS = ['projects', 'research', 'achievements']
+# Mirrors itemsPerPage in js/config.js
+ITEMS_PER_PAGE = 3
+
+
+# --- PHASE TIMINGS ---
+# Exclusive wall time per build phase: time spent in a nested phase is
+# booked to the nested phase only. With --profile every span is also kept
+# as a Chrome trace event, and --cprofile-dir dumps a cProfile per
+# top-level phase.
+
+phase_times = {}
+_phase_stack = []
+card_times = []
+counts = {}
+profiling = {'events': None, 'cprofile_dir': None, 'origin': time.perf_counter()}
+
+
+def count(name, n=1):
+    counts[name] = counts.get(name, 0) + n
+
+
+def trace_event(name, category, start, duration, tid=None, args=None):
+    if profiling['events'] is None:
+        return
+    event = {
+        'name': name, 'cat': category, 'ph': 'X', 'pid': os.getpid(), 'tid': tid or os.getpid(),
+        'ts': round((start - profiling['origin']) * 1e6, 3), 'dur': round(duration * 1e6, 3)
+    }
+    if args:
+        event['args'] = args
+    profiling['events'].append(event)
+
+
+@contextmanager
+def phase(name):
+    start = time.perf_counter()
+    profiler = None
+    if not _phase_stack and profiling['cprofile_dir']:
+        import cProfile
+        profiler = cProfile.Profile()
+        profiler.enable()
+    _phase_stack.append(0.0)
+    try:
+        yield
+    finally:
+        elapsed = time.perf_counter() - start
+        nested = _phase_stack.pop()
+        phase_times[name] = phase_times.get(name, 0.0) + elapsed - nested
+        if _phase_stack:
+            _phase_stack[-1] += elapsed
+        trace_event(name, 'phase', start, elapsed)
+        if profiler:
+            profiler.disable()
+            slug = re.sub(r'[^\w]+', '-', name).strip('-').lower()
+            profiler.dump_stats(os.path.join(profiling['cprofile_dir'], f'{slug}.prof'))
+
+
+# Book the time spent producing each item of a lazy iterable to a phase,
+# for sections that only render while the page is being written
+def timed(name, iterable):
+    it = iter(iterable)
+    while True:
+        with phase(name):
+            item = next(it, None)
+        if item is None:
+            return
+        yield item
+
+
+def record_card(section, item, start, duration, tid=None):
+    card_id = item.get('id') or item.get('title') or item.get('name') or item.get('category', '')
+    card_times.append((duration, section, card_id))
+    trace_event(f'{section}/{card_id}', 'card', start, duration, tid)
+
+
+def reset_stats():
+    phase_times.clear()
+    card_times.clear()
+    counts.clear()
+    markdown_cache.memory_hits = markdown_cache.disk_hits = markdown_cache.misses = 0
+    if profiling['events'] is not None:
+        profiling['events'] = []
+
+
+def write_timings(path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'phases': phase_times, 'counts': counts}, f, indent=2)
+
+
+def write_trace(path):
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump({'traceEvents': profiling['events'], 'displayTimeUnit': 'ms'}, f)
+
+
+def print_profile(top):
+    print("-" * 30)
+    print(f"Slowest phases (top {top}):")
+    for name, seconds in sorted(phase_times.items(), key=lambda kv: -kv[1])[:top]:
+        print(f"{seconds * 1000:10.2f} ms  {name}")
+    if card_times:
+        print(f"Slowest cards (top {top} of {len(card_times)} rendered):")
+        for seconds, section, card_id in sorted(card_times, reverse=True)[:top]:
+            print(f"{seconds * 1000:10.2f} ms  {section}/{card_id}")
+    print("Counts:")
+    for name, n in sorted(counts.items()):
+        print(f"{n:10d}  {name}")
+    print("-" * 30)
+
+
+# --- BUILD MANIFEST ---
+
+def sha256_bytes(content):
+    return hashlib.sha256(content).hexdigest()
+
+
+def sha256_json(obj):
+    return sha256_bytes(json.dumps(obj, sort_keys=True, ensure_ascii=False).encode('utf-8'))
+
+
+def rel_path(path):
+    return os.path.relpath(path, BASE_DIR).replace(os.sep, '/')
+
+
+def load_manifest():
+    try:
+        with open(MANIFEST_FILE, 'r', encoding='utf-8') as f:
+            manifest = json.load(f)
+        if manifest.get('version') == MANIFEST_VERSION:
+            return manifest
+    except (OSError, ValueError):
+        pass
+    return {'version': MANIFEST_VERSION, 'files': {}, 'outputs': {}}
+
+
+def save_manifest(manifest):
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    tmp_path = MANIFEST_FILE + '.tmp'
+    with open(tmp_path, 'w', encoding='utf-8') as f:
+        json.dump(manifest, f, indent=1, sort_keys=True)
+    os.replace(tmp_path, MANIFEST_FILE)
+
+
+# Hash a file, reusing the previous hash when size and mtime are unchanged
+def hash_file(path, previous):
+    st = os.stat(path)
+    entry = previous.get(rel_path(path))
+    if entry and entry['size'] == st.st_size and entry['mtime'] == st.st_mtime_ns:
+        return entry
+    with open(path, 'rb') as f:
+        content = f.read()
+    return {'size': st.st_size, 'mtime': st.st_mtime_ns, 'hash': sha256_bytes(content)}
+
+
+def scan_inputs(manifest):
+    paths = [os.path.abspath(__file__), TEMPLATE_FILE]
+    paths += sorted(glob.glob(os.path.join(DATA_DIR, '*.json')))
+    paths += sorted(glob.glob(os.path.join(DETAILS_DIR, '**', '*.md'), recursive=True))
+    paths += sorted(glob.glob(os.path.join(IMAGES_DIR, '*.*')))
+    paths += sorted(glob.glob(os.path.join(CSS_DIR, '*.css')))
+    paths += sorted(glob.glob(os.path.join(JS_DIR, '*.js')))
+    paths.append(ARCHIVE_FILE)
+
+    files = {}
+    for path in paths:
+        if os.path.exists(path):
+            files[rel_path(path)] = hash_file(path, manifest['files'])
+    return files
+
+
+def output_signature(files, deps, options=()):
+    compiler = files[rel_path(os.path.abspath(__file__))]['hash']
+    parts = [compiler] + list(options) + [f"{name}:{files[name]['hash'] if name in files else '-'}" for name in deps]
+    return sha256_bytes('\n'.join(parts).encode('utf-8'))
+
+
+def output_deps(files):
+    data_file = lambda key: f"data/{key}.json"
+    return {
+        OUTPUT_FILE: sorted(name for name in files if name not in ('compile.py', rel_path(ARCHIVE_FILE))),
+        SITEMAP_FILE: [data_file(key) for key in SITEMAP_DATA] + sorted(name for name in files if name.startswith('details/')),
+        LLMS_FILE: [data_file(key) for key in LLMS_DATA] + sorted(name for name in files if name.startswith('details/')),
+        SEARCH_INDEX_FILE: [data_file(key) for key in SEARCH_DATA] + sorted(name for name in files if name.startswith('details/')),
+        ARCHIVE_MANIFEST_FILE: [rel_path(ARCHIVE_FILE)],
+    }
+
+
+# Inputs whose last commit dates the build, relative to BASE_DIR
+SOURCE_DATE_PATHS = ['compile.py', 'index-dynamic.html', 'data', 'details', 'images', 'css', 'js']
+
+
+# Time of the newest commit touching the inputs, or None when git is not
+# available, BASE_DIR is not a checkout or a tracked input has uncommitted
+# changes (the commit would predate the content). A shallow clone (the
+# actions/checkout default) only has HEAD, whose time would change on every
+# push: dates need full history (fetch-depth: 0) or SOURCE_DATE_EPOCH.
+def git_commit_time(paths):
+    import subprocess
+    def git(*args):
+        return subprocess.run(['git', *args], cwd=BASE_DIR, capture_output=True,
+                              text=True, check=True).stdout.strip()
+    try:
+        if git('rev-parse', '--is-shallow-repository') == 'true':
+            print("Shallow clone: dating the build from the manifest, fetch full history or set SOURCE_DATE_EPOCH")
+            return None
+        if git('status', '--porcelain', '--untracked-files=no', '--', *paths):
+            return None
+        return int(git('log', '-1', '--format=%ct', '--', *paths)) or None
+    except (OSError, ValueError, subprocess.CalledProcessError):
+        return None
+
+
+# The build's "now" for the footer and sitemap dates: SOURCE_DATE_EPOCH
+# when set, otherwise the time of the newest commit to the inputs, so a
+# fresh clone in CI renders the same bytes as the checkout that committed
+# them. Without git (or in a shallow clone) it is the first build that saw
+# the current set of inputs, kept in the manifest. Either way it is looked
+# up once per input set.
+def source_date(manifest, files):
+    epoch = os.environ.get('SOURCE_DATE_EPOCH')
+    if epoch:
+        return datetime.fromtimestamp(int(epoch), timezone.utc)
+    inputs = sha256_json(sorted((name, entry['hash']) for name, entry in files.items()))
+    if manifest.get('source_date', [None])[0] != inputs:
+        paths = [path for path in SOURCE_DATE_PATHS if os.path.exists(os.path.join(BASE_DIR, path))]
+        manifest['source_date'] = [inputs, git_commit_time(paths) or int(time.time())]
+    return datetime.fromtimestamp(manifest['source_date'][1], timezone.utc)
+
+
+# Files written together with an output; they share its signature and are
+# checked and recorded with it
+def companion_outputs(path):
+    if path == LLMS_FILE:
+        return [LLMS_FULL_FILE] + [os.path.join(BASE_DIR, name) for name in LLMS_BUDGETS]
+    return []
+
+
+def output_is_fresh(manifest, path, signature):
+    for output in [path] + companion_outputs(path):
+        entry = manifest['outputs'].get(rel_path(output))
+        if not entry or entry['inputs'] != signature or not os.path.exists(output):
+            return False
+        # Rebuild when the output was edited or replaced by hand
+        st = os.stat(output)
+        if entry['size'] != st.st_size or entry['mtime'] != st.st_mtime_ns:
+            return False
+    return True
+
+
+def record_output(manifest, path, signature):
+    for output in [path] + companion_outputs(path):
+        st = os.stat(output)
+        manifest['outputs'][rel_path(output)] = {
+            'inputs': signature, 'size': st.st_size, 'mtime': st.st_mtime_ns
+        }
+
+
+# --- FRAGMENT CACHE ---
 
-print(f"Compiling {TEMPLATE_FILE}...")
+class FragmentCache:
+    # Rendered HTML fragments stored under .build-cache/fragments, keyed by
+    # the hash of everything that went into them.
+    def __init__(self, compiler_hash, files, options=None):
+        self.compiler_hash = compiler_hash
+        self.files = files
+        self.options = sorted((options or {}).items())
+        self.used = set()
+        self.rendered = {}
+        self.hits = 0
+        self.misses = 0
 
-# Load Data
-data = {}
-if os.path.exists(DATA_DIR):
-    for filename in os.listdir(DATA_DIR):
-        if filename.endswith('.json'):
-            key = filename.replace('.json', '')
+    def key(self, kind, item, detail=None):
+        detail_hash = None
+        if detail:
+            detail_hash = self.files.get(detail, {}).get('hash')
+        key = sha256_json([self.compiler_hash, self.options, kind, item, detail, detail_hash])
+        self.used.add(key)
+        return key
+
+    def path(self, key):
+        return os.path.join(FRAGMENT_DIR, key + '.html')
+
+    def has(self, key):
+        return os.path.exists(self.path(key))
+
+    def get(self, key, render):
+        if key in self.rendered:
+            return self.rendered.pop(key)
+        if self.has(key):
+            with open(self.path(key), 'r', encoding='utf-8') as f:
+                self.hits += 1
+                return f.read()
+
+        self.misses += 1
+        html = render()
+        self.put(key, html)
+        return html
+
+    # Write a fragment through to disk. Only prerender_cards() also keeps the
+    # HTML in self.rendered, for the get() that splices it in.
+    def put(self, key, html):
+        os.makedirs(FRAGMENT_DIR, exist_ok=True)
+        with open(self.path(key), 'w', encoding='utf-8') as f:
+            f.write(html)
+
+    # Yield a fragment in blocks so a whole section never sits in memory.
+    # On a miss the produced chunks are written to the cache as they pass.
+    def stream(self, key, produce):
+        if self.has(key):
+            self.hits += 1
+            with open(self.path(key), 'r', encoding='utf-8') as f:
+                while True:
+                    block = f.read(STREAM_BLOCK_SIZE)
+                    if not block:
+                        return
+                    yield block
+
+        self.misses += 1
+        os.makedirs(FRAGMENT_DIR, exist_ok=True)
+        tmp_path = self.path(key) + '.tmp'
+        with open(tmp_path, 'w', encoding='utf-8') as f:
+            for chunk in produce():
+                f.write(chunk)
+                yield chunk
+        os.replace(tmp_path, self.path(key))
+
+    # Drop fragments that no longer belong to any card or section
+    def prune(self):
+        if not os.path.isdir(FRAGMENT_DIR):
+            return
+        for filename in os.listdir(FRAGMENT_DIR):
+            if filename[:-len('.html')] not in self.used:
+                os.remove(os.path.join(FRAGMENT_DIR, filename))
+
+
+# --- DATA ---
+# Every data file is checked against its schema as it is loaded, so a
+# missing or mistyped field stops the build before anything is rendered,
+# with the file and JSON path of every problem.
+#
+# A schema is a type, a tuple of types, [spec] for a list of spec, or
+# {key: spec} for an object. Keys ending in '?' are optional, and a '*' key
+# matches every key the object does not declare. Fields the renderers read
+# with item[...] are required; unknown fields are allowed.
+
+DATA_SCHEMAS = {
+    'about': {
+        'name?': str, 'tagline?': str, 'bio?': str, 'email?': str, 'photo?': str, 'resume?': str,
+        'googleScholar?': str, 'codingProfiles?': {'*': str}, 'socials?': {'*': str}
+    },
+    'techstack': [{'category': str, 'skills': [str]}],
+    'projects': [{'id': str, 'title': str, 'tech': [str], 'summary': str, 'detail?': str, 'links?': {'*': str}}],
+    'research': [{'id': str, 'title': str, 'publisher': str, 'year': (str, int), 'summary': str,
+                  'doi?': str, 'link?': str}],
+    'achievements': [{'id': str, 'title': str, 'date': str, 'summary': str, 'detail?': str, 'link?': str}],
+    'certifications': [{'id': str, 'title': str, 'issuer': str, 'date': str, 'link?': str}],
+    'experience': [{'role': str, 'company': str, 'duration': str, 'description': str}],
+    'education': [{'degree': str, 'institution': str, 'year': (str, int), 'grade': str}],
+}
+JSON_TYPE_NAMES = {str: 'string', int: 'integer', float: 'number', bool: 'boolean', list: 'array', dict: 'object'}
+
+
+class DataError(Exception):
+    def __init__(self, errors):
+        super().__init__('\n'.join(errors))
+        self.errors = errors
+
+
+def json_type(value):
+    return 'null' if value is None else JSON_TYPE_NAMES.get(type(value), type(value).__name__)
+
+
+def validate(value, spec, path, errors):
+    if isinstance(spec, list):
+        if not isinstance(value, list):
+            errors.append(f"{path}: expected array, got {json_type(value)}")
+            return
+        for i, item in enumerate(value):
+            validate(item, spec[0], f'{path}[{i}]', errors)
+    elif isinstance(spec, dict):
+        if not isinstance(value, dict):
+            errors.append(f"{path}: expected object, got {json_type(value)}")
+            return
+        declared = set()
+        for key, field in spec.items():
+            name = key.rstrip('?')
+            declared.add(name)
+            if name in value:
+                validate(value[name], field, f'{path}.{name}', errors)
+            elif key != '*' and not key.endswith('?'):
+                errors.append(f"{path}: missing required field '{name}'")
+        if '*' in spec:
+            for name, item in value.items():
+                if name not in declared:
+                    validate(item, spec['*'], f'{path}.{name}', errors)
+    else:
+        types = spec if isinstance(spec, tuple) else (spec,)
+        # bool is an int subclass, but true is not a year
+        if not isinstance(value, types) or (isinstance(value, bool) and bool not in types):
+            expected = ' or '.join(JSON_TYPE_NAMES[t] for t in types)
+            errors.append(f"{path}: expected {expected}, got {json_type(value)}")
+
+
+# Card ids become anchors and --static-pages directories, so they must be unique
+def validate_ids(items, errors):
+    seen = {}
+    for i, item in enumerate(items):
+        if isinstance(item, dict) and isinstance(item.get('id'), str):
+            if item['id'] in seen:
+                errors.append(f"$[{i}].id: duplicate id '{item['id']}', first used at $[{seen[item['id']]}]")
+            seen.setdefault(item['id'], i)
+
+
+# orjson when it is installed, imported on first use
+def json_loads(content):
+    if json_loads.parser is None:
+        try:
+            import orjson
+            json_loads.parser = orjson.loads
+        except ImportError:
+            json_loads.parser = json.loads
+    return json_loads.parser(content)
+
+
+json_loads.parser = None
+
+
+def parse_data_file(filename):
+    name = f'data/{filename}'
+    with open(os.path.join(DATA_DIR, filename), 'rb') as f:
+        content = f.read()
+    try:
+        value = json_loads(content)
+    except json.JSONDecodeError as e:
+        return None, [f"{name}:{e.lineno}:{e.colno}: {e.msg}"]
+    errors = []
+    key = filename[:-len('.json')]
+    if key in DATA_SCHEMAS:
+        validate(value, DATA_SCHEMAS[key], '$', errors)
+        if isinstance(value, list):
+            validate_ids(value, errors)
+    return value, [f"{name}: {error}" for error in errors]
+
+
+# In watch mode `loaded` keeps the parsed files between builds, keyed by
+# content hash, so only the files that changed are parsed again. Raises
+# DataError listing every problem in every file.
+def load_data(files=None, loaded=None):
+    data = {}
+    errors = []
+    if os.path.exists(DATA_DIR):
+        for filename in sorted(os.listdir(DATA_DIR)):
+            if filename.endswith('.json'):
+                key = filename.replace('.json', '')
+                file_hash = (files or {}).get(f'data/{filename}', {}).get('hash')
+                if loaded is not None and file_hash and loaded.get(key, (None,))[0] == file_hash:
+                    data[key] = loaded[key][1]
+                    continue
+                try:
+                    value, problems = parse_data_file(filename)
+                except OSError as e:
+                    value, problems = None, [f"data/{filename}: {e}"]
+                if problems:
+                    errors += problems
+                    continue
+                data[key] = value
+                if loaded is not None:
+                    loaded[key] = (file_hash, value)
+    if errors:
+        raise DataError(errors)
+    return data
+
+
+def print_stats(data):
+    skill_count = 0
+    if 'techstack' in data:
+        for category in data['techstack']:
+            skill_count += len(category.get('skills', []))
+
+    project_count = len(data.get('projects', []))
+    research_count = len(data.get('research', []))
+    achievement_count = len(data.get('achievements', []))
+    certification_count = len(data.get('certifications', []))
+
+    print("-" * 30)
+    print("Compilation Stats:")
+    print(f"Skills: {skill_count}")
+    print(f"Projects: {project_count}")
+    print(f"Research Papers: {research_count}")
+    print(f"Achievements: {achievement_count}")
+    print(f"Certifications: {certification_count}")
+    print("-" * 30)
+
+
+# --- MARKDOWN CACHE ---
+
+MARKDOWN_CACHE_DIR = os.path.join(CACHE_DIR, 'markdown')
+MARKDOWN_CACHE_MAX_BYTES = 64 * 1024 * 1024
+
+# Passed straight to markdown.Markdown(); part of every cache key
+MARKDOWN_CONFIG = {'extensions': [], 'extension_configs': {}, 'output_format': 'xhtml'}
+
+
+# The installed markdown version, read from markdown/__meta__.py so a build
+# whose cards all come from the cache never has to import markdown
+def markdown_version():
+    if markdown_version.value is None:
+        spec = importlib.util.find_spec('markdown')
+        locations = list(spec.submodule_search_locations or []) if spec else []
+        meta = os.path.join(locations[0], '__meta__.py') if locations else None
+        if meta and os.path.exists(meta):
+            with open(meta, 'rb') as f:
+                markdown_version.value = sha256_bytes(f.read())
+        else:
+            import markdown
+            markdown_version.value = markdown.__version__
+    return markdown_version.value
+
+
+markdown_version.value = None
+
+
+class MarkdownCache:
+    # Rendered markdown keyed by the hash of the source text and the
+    # Markdown config. Lookups go memory first, then disk; the disk layer is
+    # trimmed back to max_bytes, least recently used first (file mtime is
+    # bumped on every hit).
+    def __init__(self, directory, max_bytes):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self.memory = {}
+        self.md = None
+        self.memory_hits = 0
+        self.disk_hits = 0
+        self.misses = 0
+
+    def key(self, text):
+        return sha256_json([markdown_version(), MARKDOWN_CONFIG, text])
+
+    def render(self, text):
+        key = self.key(text)
+        if key in self.memory:
+            self.memory_hits += 1
+            return self.memory[key]
+
+        path = os.path.join(self.directory, key + '.html')
+        try:
+            with open(path, 'r', encoding='utf-8') as f:
+                html = f.read()
+            os.utime(path)
+            self.disk_hits += 1
+        except OSError:
+            # One Markdown instance for the whole build, reset between documents
+            if self.md is None:
+                import markdown
+                self.md = markdown.Markdown(**MARKDOWN_CONFIG)
+            html = self.md.reset().convert(text)
+            self.misses += 1
+            os.makedirs(self.directory, exist_ok=True)
+            tmp_path = f'{path}.{os.getpid()}.tmp'
+            with open(tmp_path, 'w', encoding='utf-8') as f:
+                f.write(html)
+            os.replace(tmp_path, path)
+
+        self.memory[key] = html
+        return html
+
+    def counters(self):
+        return self.memory_hits, self.disk_hits, self.misses
+
+    def add_counters(self, counters):
+        self.memory_hits += counters[0]
+        self.disk_hits += counters[1]
+        self.misses += counters[2]
+
+    # Evict least recently used entries until the disk layer fits
+    def trim(self):
+        if not os.path.isdir(self.directory):
+            return
+        entries = []
+        total = 0
+        # --batch workers trim the shared directory concurrently: an entry
+        # another worker evicted first is skipped, and files still being
+        # written (.tmp) are left alone
+        for entry in os.scandir(self.directory):
+            if not entry.name.endswith('.html'):
+                continue
             try:
-                with open(os.path.join(DATA_DIR, filename), 'r', encoding='utf-8') as f:
-                    data[key] = json.load(f)
-            except Exception as e:
-                print(f"Error loading {filename}: {e}")
-
-# Stats
-skill_count = 0
-if 'techstack' in data:
-    for category in data['techstack']:
-        skill_count += len(category.get('skills', []))
-
-project_count = len(data.get('projects', []))
-research_count = len(data.get('research', []))
-achievement_count = len(data.get('achievements', []))
-certification_count = len(data.get('certifications', []))
-
-print("-" * 30)
-print("Compilation Stats:")
-print(f"Skills: {skill_count}")
-print(f"Projects: {project_count}")
-print(f"Research Papers: {research_count}")
-print(f"Achievements: {achievement_count}")
-print(f"Certifications: {certification_count}")
-print("-" * 30)
-
-# Load Template
-with open(TEMPLATE_FILE, 'r', encoding='utf-8') as f:
-    soup = BeautifulSoup(f, 'html.parser')
+                st = entry.stat()
+            except FileNotFoundError:
+                continue
+            entries.append((st.st_mtime_ns, st.st_size, entry.path))
+            total += st.st_size
+        for _, size, path in sorted(entries):
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except FileNotFoundError:
+                pass
+            total -= size
+
+    def print_stats(self):
+        print("-" * 30)
+        print("Markdown Cache:")
+        print(f"Memory hits: {self.memory_hits}")
+        print(f"Disk hits: {self.disk_hits}")
+        print(f"Misses: {self.misses}")
+        print("-" * 30)
+
+
+markdown_cache = MarkdownCache(MARKDOWN_CACHE_DIR, MARKDOWN_CACHE_MAX_BYTES)
+
 
 # Helper: Render Markdown
 def render_markdown(text):
     if not text:
         return ""
-    return markdown.markdown(text)
-
-# --- SECTIONS ---
-
-# 1. Hero
-if 'about' in data:
-    about = data['about']
-    if soup.find(id='hero-name'):
-        soup.find(id='hero-name').string = about.get('name', '')
-    if soup.find(id='hero-tagline'):
-        soup.find(id='hero-tagline').string = about.get('tagline', '')
-    
-    hero_email_span = soup.find(id='hero-email')
-    # Note: In index-dynamic.html, it might be inside a container. 
-    # We look for the element with id="hero-email"
-    if hero_email_span and about.get('email'):
-        hero_email_span.clear()
-        a_tag = soup.new_tag('a', href=f"mailto:{about['email']}")
-        a_tag['class'] = 'hero-email-link'
-        a_tag.string = about['email']
-        hero_email_span.append(a_tag)
-
-# 2. About
-if 'about' in data:
-    about = data['about']
-    if soup.find(id='profile-photo'):
-        soup.find(id='profile-photo')['src'] = about.get('photo', '')
-        soup.find(id='profile-photo')['alt'] = f"{about.get('name', '')} Profile Photo"
-    
-    if soup.find(id='bio-text'):
-        soup.find(id='bio-text').string = about.get('bio', '')
-    
-    social_container = soup.find(id='social-links')
-    if social_container and about.get('socials'):
-        social_container.clear()
-        icon_map = {
-            'github': 'fa-brands fa-github',
-            'linkedin': 'fa-brands fa-linkedin',
-            'twitter': 'fa-brands fa-x-twitter'
-        }
-        not_to_display = ["discord", "instagram"]
-        
-        for platform, url in about['socials'].items():
-            if url and platform not in not_to_display:
-                a = soup.new_tag('a', href=url, target='_blank', rel='noopener noreferrer')
-                a['class'] = 'social-link'
-                
-                if platform in icon_map:
-                    i = soup.new_tag('i')
-                    i['class'] = icon_map[platform]
-                    a.append(i)
-                    
-                    span = soup.new_tag('span')
-                    span.string = platform.capitalize() if platform != 'github' else 'Github'
-                    a.append(span)
-                else:
-                    a.string = platform.capitalize()
-                
-                social_container.append(a)
-
-# 3. Tech Stack
-if 'techstack' in data:
-    container = soup.find(id='techstack-content')
-    if container:
-        container.clear()
-        for category in data['techstack']:
-            cat_div = soup.new_tag('div', attrs={'class': 'tech-category'})
-            
-            h3 = soup.new_tag('h3')
-            h3.string = category['category']
-            cat_div.append(h3)
-            
-            skills_div = soup.new_tag('div', attrs={'class': 'tech-skills'})
-            for skill in category['skills']:
-                span = soup.new_tag('span', attrs={'class': 'tech-skill'})
-                span.string = skill
-                skills_div.append(span)
-            
-            cat_div.append(skills_div)
-            container.append(cat_div)
-
-# 4. Projects
-if 'projects' in data:
-    container = soup.find(id='projects-content')
-    if container:
-        container.clear()
-        for project in data['projects']:
-            card = soup.new_tag('div', attrs={'class': 'card', 'id': project['id']})
-            
-            copy_btn = soup.new_tag('button', attrs={'class': 'copy-link', 'title': 'Copy link'})
-            copy_btn.append(BeautifulSoup('<i class="material-symbols-outlined">link</i>', 'html.parser'))
-            card.append(copy_btn)
-            
-            h3 = soup.new_tag('h3')
-            h3.string = project['title']
-            card.append(h3)
-            
-            tech_div = soup.new_tag('div', attrs={'class': 'card-tech'})
-            for tech in project['tech']:
-                span = soup.new_tag('span', attrs={'class': 'tech-tag'})
-                span.string = tech
-                tech_div.append(span)
-            card.append(tech_div)
-            
-            summary_div = soup.new_tag('div', attrs={'class': 'card-summary'})
-            summary_div.append(BeautifulSoup(render_markdown(project['summary']), 'html.parser'))
-            card.append(summary_div)
-            
-            links_div = soup.new_tag('div', attrs={'class': 'card-links'})
-            if 'links' in project:
-                for platform, url in project['links'].items():
-                    a = soup.new_tag('a', href=url, target='_blank', rel='noopener noreferrer')
-                    a.string = platform.capitalize()
-                    links_div.append(a)
-            
-            if 'detail' in project:
-                btn = soup.new_tag('button', attrs={'class': 'expand-btn'})
-                btn.string = 'Show Details'
-                links_div.append(btn)
-
-                # Embed detail content
-                detail_path = os.path.join(BASE_DIR, project['detail'])
-                if os.path.exists(detail_path):
-                    try:
-                        with open(detail_path, 'r', encoding='utf-8') as f:
-                            md_content = f.read()
-                        html_content = render_markdown(md_content)
-                        detail_div = soup.new_tag('div', attrs={'class': 'detail-content', 'style': 'display:none'})
-                        detail_div.append(BeautifulSoup(html_content, 'html.parser'))
-                        card.append(detail_div)
-                    except Exception as e:
-                        print(f"Error embedding project detail {project['detail']}: {e}")
-            
-            card.append(links_div)
-            container.append(card)
-
-# 5. Research
-if 'research' in data:
-    container = soup.find(id='research-content')
-    if container:
-        container.clear()
-        # Google Scholar Link
-        if 'about' in data and 'googleScholar' in data['about']:
-            scholar_link = soup.find(id='google-scholar-link')
-            if scholar_link:
-                scholar_link['href'] = data['about']['googleScholar']
+    return markdown_cache.render(text)
 
-        for item in data['research']:
-            card = soup.new_tag('div', attrs={'class': 'card', 'id': item['id']})
-            
-            copy_btn = soup.new_tag('button', attrs={'class': 'copy-link', 'title': 'Copy link'})
-            copy_btn.append(BeautifulSoup('<i class="material-symbols-outlined">link</i>', 'html.parser'))
-            card.append(copy_btn)
-            
-            h3 = soup.new_tag('h3')
-            h3.string = item['title']
-            card.append(h3)
-            
-            meta = soup.new_tag('div', attrs={'class': 'card-meta'})
-            meta.string = f"{item['publisher']} • {item['year']}"
-            card.append(meta)
-            
-            summary = soup.new_tag('div', attrs={'class': 'card-summary'})
-            summary.append(BeautifulSoup(render_markdown(item['summary']), 'html.parser'))
-            card.append(summary)
-            
-            links_div = soup.new_tag('div', attrs={'class': 'card-links'})
-            if 'doi' in item:
-                a = soup.new_tag('a', href=f"https://doi.org/{item['doi']}", target='_blank', rel='noopener noreferrer')
-                a.string = 'DOI'
-                links_div.append(a)
-            if 'link' in item:
-                a = soup.new_tag('a', href=item['link'], target='_blank', rel='noopener noreferrer')
-                a.string = 'Paper'
-                links_div.append(a)
-            
-            card.append(links_div)
-            container.append(card)
-
-# 6. Achievements
-if 'achievements' in data:
-    container = soup.find(id='achievements-content')
-    if container:
-        container.clear()
-        for item in data['achievements']:
-            card = soup.new_tag('div', attrs={'class': 'card', 'id': item['id']})
-            
-            copy_btn = soup.new_tag('button', attrs={'class': 'copy-link', 'title': 'Copy link'})
-            copy_btn.append(BeautifulSoup('<i class="material-symbols-outlined">link</i>', 'html.parser'))
-            card.append(copy_btn)
-            
-            h3 = soup.new_tag('h3')
-            h3.string = item['title']
-            card.append(h3)
-            
-            meta = soup.new_tag('div', attrs={'class': 'card-meta'})
-            # Try to format date
-            date_str = item['date']
-            try:
-                # Assuming YYYY-MM-DD
-                date_obj = datetime.strptime(date_str, '%Y-%m-%d')
-                # JS toLocaleDateString depends on locale, we'll use a standard format like MM/DD/YYYY or similar
-                date_str = date_obj.strftime('%m/%d/%Y')
-            except:
-                pass
-            meta.string = date_str
-            card.append(meta)
-            
-            summary = soup.new_tag('div', attrs={'class': 'card-summary'})
-            summary.append(BeautifulSoup(render_markdown(item['summary']), 'html.parser'))
-            card.append(summary)
-            
-            links_div = soup.new_tag('div', attrs={'class': 'card-links'})
-            if 'link' in item:
-                a = soup.new_tag('a', href=item['link'], target='_blank', rel='noopener noreferrer')
-                a.string = 'View'
-                links_div.append(a)
-            if 'detail' in item:
-                btn = soup.new_tag('button', attrs={'class': 'expand-btn'})
-                btn.string = 'Show Details'
-                links_div.append(btn)
-
-                # Embed detail content
-                detail_path = os.path.join(BASE_DIR, item['detail'])
-                if os.path.exists(detail_path):
-                    try:
-                        with open(detail_path, 'r', encoding='utf-8') as f:
-                            md_content = f.read()
-                        html_content = render_markdown(md_content)
-                        detail_div = soup.new_tag('div', attrs={'class': 'detail-content', 'style': 'display:none'})
-                        detail_div.append(BeautifulSoup(html_content, 'html.parser'))
-                        card.append(detail_div)
-                    except Exception as e:
-                        print(f"Error embedding achievement detail {item['detail']}: {e}")
-            
-            card.append(links_div)
-            container.append(card)
-
-# 7. Experience
-if 'experience' in data:
-    container = soup.find(id='experience-content')
-    if container:
-        container.clear()
-        for item in data['experience']:
-            div = soup.new_tag('div', attrs={'class': 'timeline-item'})
-            
-            h3 = soup.new_tag('h3')
-            h3.string = item['role']
-            div.append(h3)
-            
-            meta = soup.new_tag('div', attrs={'class': 'timeline-meta'})
-            meta.string = f"{item['company']} • {item['duration']}"
-            div.append(meta)
-            
-            desc = soup.new_tag('div', attrs={'class': 'timeline-description'})
-            desc.string = item['description']
-            div.append(desc)
-            
-            container.append(div)
-
-# 8. Certifications
-if 'certifications' in data:
-    container = soup.find(id='certifications-content')
-    if container:
-        container.clear()
-        for item in data['certifications']:
-            card = soup.new_tag('div', attrs={'class': 'card', 'id': item['id']})
-            
-            copy_btn = soup.new_tag('button', attrs={'class': 'copy-link', 'title': 'Copy link'})
-            copy_btn.append(BeautifulSoup('<i class="material-symbols-outlined">link</i>', 'html.parser'))
-            card.append(copy_btn)
-            
-            h3 = soup.new_tag('h3')
-            h3.string = item['title']
-            card.append(h3)
-            
-            meta = soup.new_tag('div', attrs={'class': 'card-meta'})
-            meta.string = f"{item['issuer']} • {item['date']}"
-            card.append(meta)
-            
-            links_div = soup.new_tag('div', attrs={'class': 'card-links'})
-            if 'link' in item:
-                a = soup.new_tag('a', href=item['link'], target='_blank', rel='noopener noreferrer')
-                a.string = 'View Certificate'
-                links_div.append(a)
-            
-            card.append(links_div)
-            container.append(card)
-
-# 9. Profiles
-if 'about' in data and 'codingProfiles' in data['about']:
-    container = soup.find(id='profiles-content')
-    if container:
-        container.clear()
-        profiles_map = [
-            {'name': 'LeetCode', 'key': 'leetcode'},
-            {'name': 'Codeforces', 'key': 'codeforces'},
-            {'name': 'CodeChef', 'key': 'codechef'}
-        ]
-        for profile in profiles_map:
-            url = data['about']['codingProfiles'].get(profile['key'])
-            if url:
-                card = soup.new_tag('div', attrs={'class': 'profile-card'})
-                
-                h3 = soup.new_tag('h3')
-                h3.string = profile['name']
-                card.append(h3)
-                
-                a = soup.new_tag('a', href=url, target='_blank', rel='noopener noreferrer')
-                a.string = 'View Profile'
-                card.append(a)
-                
-                container.append(card)
-
-# 10. Education
-if 'education' in data:
-    container = soup.find(id='education-content')
-    if container:
-        container.clear()
-        for item in data['education']:
-            div = soup.new_tag('div', attrs={'class': 'timeline-item'})
-            
-            h3 = soup.new_tag('h3')
-            h3.string = item['degree']
-            div.append(h3)
-            
-            meta = soup.new_tag('div', attrs={'class': 'timeline-meta'})
-            meta.string = f"{item['institution']} • {item['year']}"
-            div.append(meta)
-            
-            grade = soup.new_tag('div', attrs={'class': 'timeline-description'})
-            grade.string = f"Grade: {item['grade']}"
-            div.append(grade)
-            
-            container.append(div)
-
-# 11. Contact
-if 'about' in data:
-    about = data['about']
-    email_el = soup.find(id='contact-email')
-    if email_el and about.get('email'):
-        email_el.clear()
-        a = soup.new_tag('a', href=f"mailto:{about['email']}", attrs={'class': 'email-link'})
-        a.string = about['email']
-        email_el.append(a)
-    
-    social_container = soup.find(id='contact-social')
-    if social_container and about.get('socials'):
-        social_container.clear()
-        icon_map = {
-            'github': 'fa-brands fa-github',
-            'linkedin': 'fa-brands fa-linkedin',
-            'twitter': 'fa-brands fa-x-twitter',
-            'instagram': 'fa-brands fa-instagram',
-            'discord': 'fa-brands fa-discord'
-        }
-        for platform, url in about['socials'].items():
-            if url and platform in icon_map:
-                a = soup.new_tag('a', href=url, target='_blank', rel='noopener noreferrer', attrs={'class': 'contact-social-link'})
-                
-                i = soup.new_tag('i', attrs={'class': icon_map[platform]})
-                a.append(i)
-                
-                span = soup.new_tag('span')
-                span.string = platform.capitalize() if platform != 'github' else 'Github'
-                a.append(span)
-                
-                social_container.append(a)
-
-# 12. Footer
-if 'about' in data:
-    if soup.find(id='footer-name'):
-        soup.find(id='footer-name').string = data['about'].get('name', '')
-    
-    if 'socials' in data['about']:
-        socials = data['about']['socials']
-        social_links = {
-            'github-link': socials.get('github'),
-            'linkedin-link': socials.get('linkedin'),
-            'twitter-link': socials.get('twitter'),
-            'instagram-link': socials.get('instagram'),
-            'discord-link': socials.get('discord')
-        }
-        for id_val, url in social_links.items():
-            el = soup.find(id=id_val)
-            if el and url:
-                el['href'] = url
-    
-    # Add Last Updated
-    footer_content = soup.find('div', class_='footer-content')
-    if footer_content:
-        # Find the copyright p tag
-        copyright_p = footer_content.find('p')
-        
-        # Create timestamp
-        ist = pytz.timezone('Asia/Kolkata')
-        now = datetime.now(ist)
-        # Format: Last Update on 28/11/2025 11:41 pm IST
-        timestamp_str = now.strftime("Last Update on %d/%m/%Y %I:%M %p IST")
-        
-        # Create new p tag
-        update_p = soup.new_tag('p')
-        update_p.string = timestamp_str
-        
-        if copyright_p:
-            copyright_p.insert_after(update_p)
-        else:
-            footer_content.insert(0, update_p)
 
-# 13. Toggle Skeleton Classes
-skeleton_ids = [
-    'hero-skeleton', 'about-skeleton', 'techstack-skeleton', 
+# Helper: Escape text and attribute values the way BeautifulSoup's default
+# formatter does, so string-rendered cards match the old DOM output
+def escape(text):
+    return str(text).replace('&', '&amp;').replace('<', '&lt;').replace('>', '&gt;')
+
+
+def escape_attr(value):
+    return escape(value).replace('"', '&quot;')
+
+
+# Helper: Markdown emits XHTML-style void tags ("<br />"), the DOM
+# serialiser wrote them as "<br/>"
+def render_markdown_fragment(text):
+    return render_markdown(text).replace(' />', '/>')
+
+
+def link(url, text, attrs=''):
+    return f'<a {attrs}href="{escape_attr(url)}" rel="noopener noreferrer" target="_blank">{text}</a>'
+
+
+# --- OUTPUT ---
+
+# Write to a temporary file and rename it over path. When the new content
+# hashes the same as the existing file, the file is left untouched, so an
+# unchanged build keeps its mtimes and gives deploy tools nothing to upload.
+# Returns whether path changed.
+def write_atomic(path, chunks, binary=False):
+    directory = os.path.dirname(path)
+    fd, tmp_path = tempfile.mkstemp(dir=directory, prefix='.' + os.path.basename(path) + '.')
+    try:
+        with (os.fdopen(fd, 'wb') if binary else os.fdopen(fd, 'w', encoding='utf-8', newline='')) as f:
+            for chunk in chunks:
+                f.write(chunk)
+        if os.path.exists(path) and os.path.getsize(path) == os.path.getsize(tmp_path) \
+                and hash_stream(path) == hash_stream(tmp_path):
+            count('write.unchanged')
+            os.remove(tmp_path)
+            return False
+        os.chmod(tmp_path, 0o644)
+        os.replace(tmp_path, path)
+        count('write.changed')
+        return True
+    except BaseException:
+        if os.path.exists(tmp_path):
+            os.remove(tmp_path)
+        raise
+
+
+def hash_stream(path):
+    digest = hashlib.sha256()
+    with open(path, 'rb') as f:
+        for block in iter(lambda: f.read(STREAM_BLOCK_SIZE), b''):
+            digest.update(block)
+    return digest.hexdigest()
+
+
+RAW_TEXT_PATTERN = re.compile(r'(<(script|style|pre|textarea)\b.*?</\2>)', re.S | re.I)
+
+
+# Helper: Drop comments and indentation whitespace between tags. Contents of
+# script, style, pre and textarea elements are left untouched.
+def minify_html(html):
+    out = []
+    for i, segment in enumerate(RAW_TEXT_PATTERN.split(html)):
+        if i % 3 == 0:
+            segment = re.sub(r'<!--(?!\[if).*?-->', '', segment, flags=re.S)
+            segment = re.sub(r'>\s*\n\s*', '>', segment)
+            segment = re.sub(r'\s*\n\s*<', '<', segment)
+            out.append(segment)
+        elif i % 3 == 1:
+            out.append(segment)
+    return ''.join(out)
+
+
+# --- TEMPLATE ---
+
+SLOT_PATTERN = re.compile(r'\{\{slot:([\w.-]+)\}\}')
+TEMPLATE_CACHE_FILE = os.path.join(CACHE_DIR, 'template.json')
+PAGE_TEMPLATE_CACHE_FILE = os.path.join(CACHE_DIR, 'template-page.json')
+
+# Elements whose contents are replaced at render time
+INNER_SLOTS = [
+    'hero-name', 'hero-tagline', 'hero-email', 'bio-text', 'social-links',
+    'techstack-content', 'projects-content', 'research-content',
+    'achievements-content', 'experience-content', 'certifications-content',
+    'profiles-content', 'education-content', 'contact-email', 'contact-social',
+    'footer-name'
+]
+
+# Elements that can take extra attributes at render time
+EXTRA_ATTR_SLOTS = ['profile-photo']
+
+# Attributes rewritten at render time, as (element id, attribute)
+ATTR_SLOTS = [
+    ('profile-photo', 'src'), ('profile-photo', 'alt'),
+    ('google-scholar-link', 'href'), ('resume-link', 'href'),
+    ('github-link', 'href'), ('linkedin-link', 'href'), ('twitter-link', 'href'),
+    ('instagram-link', 'href'), ('discord-link', 'href')
+]
+
+SKELETON_IDS = [
+    'hero-skeleton', 'about-skeleton', 'techstack-skeleton',
     'projects-skeleton', 'research-skeleton', 'achievements-skeleton',
     'experience-skeleton', 'certifications-skeleton', 'profiles-skeleton',
     'education-skeleton'
 ]
 
-content_ids = [
+# Head tags rewritten per page in the --static-pages template:
+# (tag, identifying attribute, its value, attribute holding the slot, slot)
+PAGE_HEAD_SLOTS = [
+    ('meta', 'name', 'description', 'content', 'page-description'),
+    ('link', 'rel', 'canonical', 'href', 'page-url'),
+    ('meta', 'property', 'og:url', 'content', 'page-url'),
+    ('meta', 'property', 'og:title', 'content', 'page-title'),
+    ('meta', 'property', 'og:description', 'content', 'page-description'),
+    ('meta', 'name', 'twitter:url', 'content', 'page-url'),
+    ('meta', 'name', 'twitter:title', 'content', 'page-title'),
+    ('meta', 'name', 'twitter:description', 'content', 'page-description')
+]
+
+CONTENT_IDS = [
     'hero-content', 'about-content', 'techstack-content',
     'projects-content', 'research-content', 'achievements-content',
     'experience-content', 'certifications-content', 'profiles-content',
@@ -478,151 +812,2920 @@ content_ids = [
     'achievements-pagination', 'certifications-pagination', 'google-scholar-link'
 ]
 
-for sk_id in skeleton_ids:
-    el = soup.find(id=sk_id)
-    if el:
-        # Add skeleton-hidden
-        classes = el.get('class', [])
-        if 'skeleton-hidden' not in classes:
-            classes.append('skeleton-hidden')
-            el['class'] = classes
-
-for ct_id in content_ids:
-    el = soup.find(id=ct_id)
-    if el:
-        # Remove skeleton-hidden
-        classes = el.get('class', [])
-        if 'skeleton-hidden' in classes:
-            classes.remove('skeleton-hidden')
-            el['class'] = classes
-
-# Save
-with open(OUTPUT_FILE, 'w', encoding='utf-8') as f:
-    f.write(str(soup.prettify()))
-
-print(f"Successfully compiled {TEMPLATE_FILE} to {OUTPUT_FILE}")
 
-# --- SITEMAP GENERATION ---
-print("Updating sitemap.xml...")
-base_url = "https://dinesh-kumar-e.github.io/"
-sitemap_urls = [
-    {"loc": base_url, "priority": "1.0", "changefreq": "weekly"},
-    {"loc": base_url + "#about", "priority": "0.9", "changefreq": "monthly"},
-    {"loc": base_url + "#techstack", "priority": "0.8", "changefreq": "monthly"},
-    {"loc": base_url + "#projects", "priority": "0.9", "changefreq": "weekly"},
-]
+# Index every element with an id, plus <head> and the footer-content div,
+# in a single walk over the tree. Like soup.find(), the first element wins
+# on duplicates.
+def index_elements(soup):
+    ids = {}
+    landmarks = {}
+    for el in soup.find_all(True):
+        el_id = el.get('id')
+        if el_id and el_id not in ids:
+            ids[el_id] = el
+        if el.name == 'head':
+            landmarks.setdefault('head', el)
+        if el.name == 'div' and 'footer-content' in el.get('class', []):
+            landmarks.setdefault('footer-content', el)
+    return ids, landmarks
 
-# Add projects to sitemap
-if 'projects' in data:
-    for project in data['projects']:
-        sitemap_urls.append({
-            "loc": f"{base_url}#projects/{project['id']}",
-            "priority": "0.8",
-            "changefreq": "monthly"
-        })
-
-# Add research to sitemap
-if 'research' in data:
-    for item in data['research']:
-        sitemap_urls.append({
-            "loc": f"{base_url}#research/{item['id']}",
-            "priority": "0.7",
-            "changefreq": "monthly"
-        })
-
-# Generate XML content
-sitemap_content = '<?xml version="1.0" encoding="UTF-8"?>\n'
-sitemap_content += '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" xmlns:image="http://www.google.com/schemas/sitemap-image/1.1">\n'
-today = datetime.now().strftime("%Y-%m-%d")
-
-for url in sitemap_urls:
-    sitemap_content += '  <url>\n'
-    sitemap_content += f'    <loc>{url["loc"]}</loc>\n'
-    sitemap_content += f'    <lastmod>{today}</lastmod>\n'
-    sitemap_content += f'    <changefreq>{url["changefreq"]}</changefreq>\n'
-    sitemap_content += f'    <priority>{url["priority"]}</priority>\n'
-    
-    # Add image for root URL
-    if url["loc"] == base_url and 'about' in data and 'photo' in data['about']:
-        photo_url = base_url + data['about']['photo']
-        sitemap_content += '    <image:image>\n'
-        sitemap_content += f'      <image:loc>{photo_url}</image:loc>\n'
-        sitemap_content += f'      <image:title>{data["about"].get("name", "")} - {data["about"].get("tagline", "")}</image:title>\n'
-        sitemap_content += '    </image:image>\n'
-        
-    sitemap_content += '  </url>\n'
-
-sitemap_content += '</urlset>'
-
-with open(os.path.join(BASE_DIR, 'sitemap.xml'), 'w', encoding='utf-8') as f:
-    f.write(sitemap_content)
-print("Successfully updated sitemap.xml")
 
-# --- LLMS.TXT GENERATION ---
-print("Generating llms.txt...")
-llms_content = ""
-if 'about' in data:
-    name = data['about'].get('name', 'Portfolio')
-    tagline = data['about'].get('tagline', '')
-    bio = data['about'].get('bio', '')
-    
-    llms_content += f"# {name}\n\n"
-    if tagline:
-        llms_content += f"> {tagline}\n\n"
-    if bio:
-        llms_content += f"{bio}\n\n"
-
-# Projects
-if 'projects' in data:
-    llms_content += "## Projects\n\n"
-    for project in data['projects']:
-        title = project.get('title', 'Project')
-        summary = project.get('summary', '')
-        # Determine link
-        link = ""
-        links = project.get('links', {})
-        if 'github' in links:
-            link = links['github']
-        elif 'demo' in links:
-            link = links['demo']
-        else:
-            link = f"{base_url}#projects/{project.get('id', '')}"
-            
-        llms_content += f"- [{title}]({link}): {summary}\n"
-    llms_content += "\n"
-
-# Research
-if 'research' in data:
-    llms_content += "## Research\n\n"
-    for item in data['research']:
-        title = item.get('title', 'Paper')
-        summary = item.get('summary', '')
-        link = item.get('link') or (f"https://doi.org/{item['doi']}" if 'doi' in item else "")
-        if not link:
-             link = f"{base_url}#research/{item.get('id', '')}"
-        
-        llms_content += f"- [{title}]({link}): {summary}\n"
-    llms_content += "\n"
-
-# Experience
-if 'experience' in data:
-    llms_content += "## Experience\n\n"
-    for item in data['experience']:
-        role = item.get('role', '')
-        company = item.get('company', '')
-        desc = item.get('description', '')
-        llms_content += f"- **{role}** at {company}: {desc}\n"
-    llms_content += "\n"
-
-# Skills
-if 'techstack' in data:
-    llms_content += "## Skills\n\n"
-    for category in data['techstack']:
-        cat_name = category.get('category', '')
-        skills = ", ".join(category.get('skills', []))
-        llms_content += f"- **{cat_name}**: {skills}\n"
-    llms_content += "\n"
-
-with open(os.path.join(BASE_DIR, 'llms.txt'), 'w', encoding='utf-8') as f:
-    f.write(llms_content)
-print("Successfully generated llms.txt")
+class Template:
+    # index-dynamic.html compiled down to static chunks and named slots.
+    # parts alternates static HTML and slot names: [html, slot, html, ...].
+    # A slot without a value renders its original template content.
+    # compact_parts is the same list with the static HTML minified.
+    def __init__(self, parts, defaults, compact_parts=None):
+        self.parts = parts
+        self.defaults = defaults
+        if compact_parts is None:
+            compact_parts = [minify_html(part) if i % 2 == 0 else part for i, part in enumerate(parts)]
+        self.compact_parts = compact_parts
+
+    # The page template (--static-pages) keeps the head, navigation and
+    # footer but swaps <main> for a single 'page-main' slot. A <base> tag
+    # makes every relative URL in the shared chrome resolve from the site
+    # root, whatever the page's depth.
+    @staticmethod
+    def prepare_page(soup, defaults):
+        head = soup.find('head')
+        if head:
+            defaults['page-root'] = ''
+            head.insert(0, '{{slot:page-root}}')
+            title = head.find('title')
+            if title:
+                defaults['page-title'] = title.decode_contents()
+                title.string = '{{slot:page-title}}'
+            for tag, key, value, attr, slot in PAGE_HEAD_SLOTS:
+                el = head.find(tag, attrs={key: value})
+                if el:
+                    defaults.setdefault(slot, escape_attr(el.get(attr, '')))
+                    el[attr] = f'{{{{slot:{slot}}}}}'
+
+        main = soup.find('main')
+        if main:
+            defaults['page-main'] = ''
+            main.clear()
+            main.append('{{slot:page-main}}')
+        if soup.body:
+            soup.body['data-static-page'] = ''
+
+    @classmethod
+    def compile(cls, html, page=False):
+        from bs4 import BeautifulSoup
+        count('template.parse')
+        soup = BeautifulSoup(html, 'html.parser')
+        defaults = {}
+        if page:
+            cls.prepare_page(soup, defaults)
+        ids, landmarks = index_elements(soup)
+
+        for slot in INNER_SLOTS:
+            el = ids.get(slot)
+            if el:
+                defaults[slot] = el.decode_contents()
+                el.clear()
+                el.append(f'{{{{slot:{slot}}}}}')
+
+        for el_id, attr in ATTR_SLOTS:
+            el = ids.get(el_id)
+            if el:
+                slot = f'{el_id}.{attr}'
+                defaults[slot] = escape_attr(el.get(attr, ''))
+                el[attr] = f'{{{{slot:{slot}}}}}'
+
+        # Extra attributes are spliced in through a valueless marker attribute
+        for el_id in EXTRA_ATTR_SLOTS:
+            el = ids.get(el_id)
+            if el:
+                slot = f'{el_id}.attrs'
+                defaults[slot] = ''
+                el[f'{{{{slot:{slot}}}}}'] = None
+
+        # The site stylesheet, so --critical-css can swap in the inline CSS
+        # and a deferred link
+        for el in soup.find_all('link', rel='stylesheet'):
+            if el.get('href') == CRITICAL_CSS_SOURCE:
+                defaults['stylesheet'] = str(el)
+                el.replace_with('{{slot:stylesheet}}')
+                break
+
+        # The site's own scripts, so --bundle can swap in the bundle. Only
+        # when they sit together, separated by nothing but whitespace.
+        local = [el for el in soup.find_all('script', src=True) if '://' not in el['src']]
+        if local:
+            nodes = [local[0]]
+            while nodes[-1] is not local[-1] and nodes[-1].next_sibling is not None:
+                nodes.append(nodes[-1].next_sibling)
+            between = [node for node in nodes if not any(node is el for el in local)]
+            if nodes[-1] is local[-1] and all(isinstance(node, str) and not node.strip() for node in between):
+                defaults['scripts'] = ''.join(str(node) for node in nodes)
+                for node in nodes[1:]:
+                    node.extract()
+                local[0].replace_with('{{slot:scripts}}')
+
+        # Page-specific <style>/<link> tags go at the end of <head>
+        if 'head' in landmarks:
+            defaults['head-extra'] = ''
+            landmarks['head'].append('{{slot:head-extra}}')
+
+        # "Last Update on ..." goes right after the copyright line
+        footer_content = landmarks.get('footer-content')
+        if footer_content:
+            defaults['footer-updated'] = ''
+            copyright_p = footer_content.find('p')
+            if copyright_p:
+                copyright_p.insert_after('{{slot:footer-updated}}')
+            else:
+                footer_content.insert(0, '{{slot:footer-updated}}')
+
+        # Toggle Skeleton Classes
+        with phase('13. Skeleton toggles'):
+            for sk_id in SKELETON_IDS:
+                el = ids.get(sk_id)
+                if el:
+                    classes = el.get('class', [])
+                    if 'skeleton-hidden' not in classes:
+                        classes.append('skeleton-hidden')
+                        el['class'] = classes
+
+            for ct_id in CONTENT_IDS:
+                el = ids.get(ct_id)
+                if el:
+                    classes = el.get('class', [])
+                    if 'skeleton-hidden' in classes:
+                        classes.remove('skeleton-hidden')
+                        el['class'] = classes
+
+        return cls(SLOT_PATTERN.split(str(soup)), defaults)
+
+    # Reuse the compiled template while neither it nor the compiler changed
+    @classmethod
+    def load(cls, path, compiler_hash, template_hash, page=False):
+        cache_file = PAGE_TEMPLATE_CACHE_FILE if page else TEMPLATE_CACHE_FILE
+        try:
+            with open(cache_file, 'r', encoding='utf-8') as f:
+                cached = json.load(f)
+            if cached['key'] == [compiler_hash, template_hash]:
+                return cls(cached['parts'], cached['defaults'], cached['compact_parts'])
+        except (OSError, ValueError, KeyError):
+            pass
+
+        with open(path, 'r', encoding='utf-8') as f:
+            template = cls.compile(f.read(), page)
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(cache_file, 'w', encoding='utf-8') as f:
+            json.dump({
+                'key': [compiler_hash, template_hash],
+                'parts': template.parts,
+                'compact_parts': template.compact_parts,
+                'defaults': template.defaults
+            }, f)
+        return template
+
+    # Yield the document in order. Slot values are strings or iterables of
+    # strings (streamed sections). Dynamic content is not minified; the card
+    # renderers already emit it without indentation.
+    def stream(self, values, compact=False):
+        for i, part in enumerate(self.compact_parts if compact else self.parts):
+            if i % 2 == 0:
+                yield part
+                continue
+            value = values.get(part, self.defaults[part])
+            if isinstance(value, str):
+                yield value
+            else:
+                yield from value
+
+    def render(self, values, compact=False):
+        return ''.join(self.stream(values, compact))
+
+
+# --- CARD RENDERERS ---
+# Each renderer returns the card as an HTML string so it can be cached.
+# Attributes are written in sorted order, as the DOM serialiser did.
+
+COPY_LINK_BUTTON = '<button class="copy-link" title="Copy link"><i class="material-symbols-outlined">link</i></button>'
+
+
+# Options that change how cards render. Set once in main() and handed to
+# pool workers through init_worker().
+render_options = {'lazy_details': False}
+
+
+def detail_button(detail):
+    if render_options['lazy_details']:
+        src = escape_attr(detail_fragment_path(detail))
+        return f'<button class="expand-btn" data-detail-src="{src}">Show Details</button>'
+    return '<button class="expand-btn">Show Details</button>'
+
+
+def embed_detail(detail, label):
+    # With --lazy-details the card only references its prerendered fragment
+    if render_options['lazy_details']:
+        return ''
+    detail_path = os.path.join(BASE_DIR, detail)
+    if os.path.exists(detail_path):
+        try:
+            with open(detail_path, 'r', encoding='utf-8') as f:
+                md_content = f.read()
+            html_content = render_markdown_fragment(md_content)
+            return f'<div class="detail-content" style="display:none">{html_content}</div>'
+        except Exception as e:
+            print(f"Error embedding {label} detail {detail}: {e}")
+    return ''
+
+
+def render_techstack_category(category):
+    skills = ''.join(f'<span class="tech-skill">{escape(skill)}</span>' for skill in category['skills'])
+    return (
+        f'<div class="tech-category"><h3>{escape(category["category"])}</h3>'
+        f'<div class="tech-skills">{skills}</div></div>'
+    )
+
+
+def render_project_card(project):
+    tech = ''.join(f'<span class="tech-tag">{escape(tech)}</span>' for tech in project['tech'])
+
+    links = ''
+    if 'links' in project:
+        for platform, url in project['links'].items():
+            links += link(url, escape(platform.capitalize()))
+
+    detail = ''
+    if 'detail' in project:
+        links += detail_button(project['detail'])
+        # Embed detail content
+        detail = embed_detail(project['detail'], 'project')
+
+    return (
+        f'<div class="card" id="{escape_attr(project["id"])}">{COPY_LINK_BUTTON}'
+        f'<h3>{escape(project["title"])}</h3>'
+        f'<div class="card-tech">{tech}</div>'
+        f'<div class="card-summary">{render_markdown_fragment(project["summary"])}</div>'
+        f'{detail}<div class="card-links">{links}</div></div>'
+    )
+
+
+def render_research_card(item):
+    links = ''
+    if 'doi' in item:
+        links += link(f"https://doi.org/{item['doi']}", 'DOI')
+    if 'link' in item:
+        links += link(item['link'], 'Paper')
+
+    return (
+        f'<div class="card" id="{escape_attr(item["id"])}">{COPY_LINK_BUTTON}'
+        f'<h3>{escape(item["title"])}</h3>'
+        f'<div class="card-meta">{escape(item["publisher"])} • {escape(item["year"])}</div>'
+        f'<div class="card-summary">{render_markdown_fragment(item["summary"])}</div>'
+        f'<div class="card-links">{links}</div></div>'
+    )
+
+
+def render_achievement_card(item):
+    # Try to format date
+    date_str = item['date']
+    try:
+        # Assuming YYYY-MM-DD
+        date_obj = datetime.strptime(date_str, '%Y-%m-%d')
+        # JS toLocaleDateString depends on locale, we'll use a standard format like MM/DD/YYYY or similar
+        date_str = date_obj.strftime('%m/%d/%Y')
+    except:
+        pass
+
+    links = ''
+    if 'link' in item:
+        links += link(item['link'], 'View')
+    detail = ''
+    if 'detail' in item:
+        links += detail_button(item['detail'])
+        # Embed detail content
+        detail = embed_detail(item['detail'], 'achievement')
+
+    return (
+        f'<div class="card" id="{escape_attr(item["id"])}">{COPY_LINK_BUTTON}'
+        f'<h3>{escape(item["title"])}</h3>'
+        f'<div class="card-meta">{escape(date_str)}</div>'
+        f'<div class="card-summary">{render_markdown_fragment(item["summary"])}</div>'
+        f'{detail}<div class="card-links">{links}</div></div>'
+    )
+
+
+def render_experience_item(item):
+    return (
+        f'<div class="timeline-item"><h3>{escape(item["role"])}</h3>'
+        f'<div class="timeline-meta">{escape(item["company"])} • {escape(item["duration"])}</div>'
+        f'<div class="timeline-description">{escape(item["description"])}</div></div>'
+    )
+
+
+def render_certification_card(item):
+    links = ''
+    if 'link' in item:
+        links += link(item['link'], 'View Certificate')
+
+    return (
+        f'<div class="card" id="{escape_attr(item["id"])}">{COPY_LINK_BUTTON}'
+        f'<h3>{escape(item["title"])}</h3>'
+        f'<div class="card-meta">{escape(item["issuer"])} • {escape(item["date"])}</div>'
+        f'<div class="card-links">{links}</div></div>'
+    )
+
+
+def render_profile_card(profile):
+    return (
+        f'<div class="profile-card"><h3>{escape(profile["name"])}</h3>'
+        f'{link(profile["url"], "View Profile")}</div>'
+    )
+
+
+def render_education_item(item):
+    return (
+        f'<div class="timeline-item"><h3>{escape(item["degree"])}</h3>'
+        f'<div class="timeline-meta">{escape(item["institution"])} • {escape(item["year"])}</div>'
+        f'<div class="timeline-description">Grade: {escape(item["grade"])}</div></div>'
+    )
+
+
+def render_social_link(platform, url, icon, css_class):
+    label = platform.capitalize() if platform != 'github' else 'Github'
+    return link(url, f'<i class="{icon}"></i><span>{escape(label)}</span>', f'class="{css_class}" ')
+
+
+# Card renderer and detail field for each *-content section
+CARD_RENDERERS = {
+    'techstack': (render_techstack_category, None),
+    'projects': (render_project_card, 'detail'),
+    'research': (render_research_card, None),
+    'achievements': (render_achievement_card, 'detail'),
+    'experience': (render_experience_item, None),
+    'certifications': (render_certification_card, None),
+    'profiles': (render_profile_card, None),
+    'education': (render_education_item, None)
+}
+
+
+# The section key is derived from its card keys, so an unchanged section is
+# a single cache read, and editing one card only re-renders that card.
+def section_keys(cache, name, items):
+    detail_key = CARD_RENDERERS[name][1]
+    keys = []
+    for item in items:
+        detail = item.get(detail_key) if detail_key else None
+        keys.append(cache.key(name, item, detail))
+    return keys, cache.key(f'{name}-section', keys)
+
+
+# Phase each section's rendering time is booked to (see timed())
+SECTION_PHASES = {
+    'techstack': '3. Tech Stack', 'projects': '4. Projects', 'research': '5. Research',
+    'achievements': '6. Achievements', 'experience': '7. Experience',
+    'certifications': '8. Certifications', 'profiles': '9. Profiles', 'education': '10. Education'
+}
+
+
+def render_timed(name, render, item):
+    start = time.perf_counter()
+    html = render(item)
+    record_card(name, item, start, time.perf_counter() - start)
+    return html
+
+
+# Render a *-content section from cached fragments
+def render_section(cache, name, items):
+    render = CARD_RENDERERS[name][0]
+    keys, section_key = section_keys(cache, name, items)
+
+    def render_cards():
+        for key, item in zip(keys, items):
+            yield cache.get(key, lambda: render_timed(name, render, item))
+
+    return timed(SECTION_PHASES[name], cache.stream(section_key, render_cards))
+
+
+def init_worker(options):
+    render_options.update(options)
+
+
+# Pool worker: must stay a module-level function so it can be pickled.
+# Returns the markdown cache counters and render timing alongside the HTML.
+def render_card(task):
+    name, item = task
+    before = markdown_cache.counters()
+    start = time.perf_counter()
+    html = CARD_RENDERERS[name][0](item)
+    duration = time.perf_counter() - start
+    counters = [now - then for now, then in zip(markdown_cache.counters(), before)]
+    return html, counters, (start, duration, os.getpid())
+
+
+# Render every card missing from the cache across a process pool, ahead of
+# the numbered sections. Results are stored by key, so the sections still
+# splice them in data order and the output does not depend on scheduling.
+def prerender_cards(cache, data, jobs):
+    pending = []
+    for name in CARD_RENDERERS:
+        items = data.get(name)
+        if not items or name == 'profiles':
+            continue
+        keys, section_key = section_keys(cache, name, items)
+        if cache.has(section_key):
+            continue
+        pending += [(key, (name, item)) for key, item in zip(keys, items) if not cache.has(key)]
+
+    if len(pending) < 2:
+        return
+
+    from concurrent.futures import ProcessPoolExecutor
+    tasks = [task for _, task in pending]
+    chunksize = max(1, len(tasks) // (jobs * 4))
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_worker, initargs=(render_options,)) as pool:
+        results = pool.map(render_card, tasks, chunksize=chunksize)
+        for (key, (name, item)), (html, counters, (start, duration, pid)) in zip(pending, results):
+            markdown_cache.add_counters(counters)
+            record_card(name, item, start, duration, pid)
+            cache.misses += 1
+            cache.put(key, html)
+            cache.rendered[key] = html
+    print(f"Rendered {len(tasks)} cards across {jobs} processes")
+
+
+# --- DETAIL FRAGMENTS ---
+# With --lazy-details every detail document is prerendered to its own HTML
+# fragment (plus compressed copies) that js/main.js fetches on "Show Details".
+
+DETAIL_BUILD_DIR = os.path.join(DETAILS_DIR, 'build')
+
+
+# details/projects/proj-0.md -> details/build/projects/proj-0.html
+def detail_fragment_path(detail):
+    rel = os.path.relpath(os.path.join(BASE_DIR, detail), DETAILS_DIR)
+    return rel_path(os.path.join(DETAIL_BUILD_DIR, os.path.splitext(rel)[0] + '.html'))
+
+
+# Write content unless the file already holds exactly these bytes
+def write_if_changed(path, content):
+    os.makedirs(os.path.dirname(path), exist_ok=True)
+    return write_atomic(path, [content], binary=True)
+
+
+# Remove fragments (and their compressed copies) not in keep: of cards that
+# no longer exist, or all of them when --lazy-details is off
+def remove_detail_fragments(keep=frozenset()):
+    for root, _, filenames in os.walk(DETAIL_BUILD_DIR, topdown=False):
+        for filename in filenames:
+            path = os.path.join(root, filename)
+            if re.sub(r'\.(gz|br)$', '', path) not in keep:
+                os.remove(path)
+        if not os.listdir(root):
+            os.rmdir(root)
+
+
+def write_detail_fragments(data):
+    keep = set()
+    written = 0
+    for name, label in (('projects', 'project'), ('achievements', 'achievement')):
+        for item in data.get(name, []):
+            if 'detail' not in item:
+                continue
+            detail_path = os.path.join(BASE_DIR, item['detail'])
+            if not os.path.exists(detail_path):
+                continue
+            try:
+                with open(detail_path, 'r', encoding='utf-8') as f:
+                    html = render_markdown_fragment(f.read()).encode('utf-8')
+            except Exception as e:
+                print(f"Error rendering {label} detail {item['detail']}: {e}")
+                continue
+
+            path = os.path.join(BASE_DIR, detail_fragment_path(item['detail']))
+            keep.add(path)
+            if write_if_changed(path, html):
+                written += 1
+            precompress(path, html)
+
+    remove_detail_fragments(keep)
+    print(f"Detail fragments: {len(keep)} total, {written} updated")
+
+
+# --- RESPONSIVE IMAGES ---
+# With --responsive-images every image the page uses is re-encoded at the
+# widths below that are narrower than the source; the source itself is the
+# widest variant. Variants are named after the source hash, so an unchanged
+# image is never encoded twice. A width whose encoding is not smaller than
+# the next wider variant (or the source) is dropped, and remembered under
+# .build-cache/images so it is not encoded again.
+
+IMAGE_BUILD_DIR = os.path.join(IMAGES_DIR, 'build')
+IMAGE_SKIP_DIR = os.path.join(CACHE_DIR, 'images')
+IMAGE_WIDTHS = [160, 320, 480, 640, 960, 1280, 1920, 2560, 3840]
+IMAGE_QUALITY = 80
+
+# Rendered size of #profile-photo, mirroring the .about-photo img rules in css/styles.css
+PROFILE_PHOTO_SIZES = '(max-width: 480px) 120px, (max-width: 768px) 150px, 200px'
+
+# CSS background images and the selector that uses them in css/styles.css
+BACKGROUND_IMAGES = {'images/bg.webp': 'body'}
+
+
+def image_variants(image, files):
+    source = os.path.join(BASE_DIR, image)
+    stem = os.path.splitext(os.path.basename(image))[0]
+    short_hash = files[image]['hash'][:10]
+
+    from PIL import Image
+    with Image.open(source) as im:
+        width, height = im.size
+        variants = [{'width': width, 'height': height, 'src': image}]
+        limit = os.path.getsize(source)
+        for w in sorted((w for w in IMAGE_WIDTHS if w < width), reverse=True):
+            h = round(height * w / width)
+            name = f'{stem}-{short_hash}-{w}w.webp'
+            path = os.path.join(IMAGE_BUILD_DIR, name)
+            skip_path = os.path.join(IMAGE_SKIP_DIR, name + '.skip')
+            if os.path.exists(skip_path):
+                continue
+            if not os.path.exists(path):
+                os.makedirs(IMAGE_BUILD_DIR, exist_ok=True)
+                tmp_path = path + '.tmp'
+                im.resize((w, h), Image.LANCZOS).save(tmp_path, 'WEBP', quality=IMAGE_QUALITY, method=6)
+                if os.path.getsize(tmp_path) >= limit:
+                    os.remove(tmp_path)
+                    os.makedirs(IMAGE_SKIP_DIR, exist_ok=True)
+                    open(skip_path, 'w').close()
+                    continue
+                os.replace(tmp_path, path)
+            limit = os.path.getsize(path)
+            variants.insert(0, {'width': w, 'height': h, 'src': rel_path(path)})
+    return {'width': width, 'height': height, 'variants': variants}
+
+
+# Remove variants not in keep: of images that changed or are no longer
+# used, or all of them when --responsive-images is off
+def remove_image_variants(keep=frozenset()):
+    for path in glob.glob(os.path.join(IMAGE_BUILD_DIR, '*')):
+        if rel_path(path) not in keep:
+            os.remove(path)
+    if os.path.isdir(IMAGE_BUILD_DIR) and not os.listdir(IMAGE_BUILD_DIR):
+        os.rmdir(IMAGE_BUILD_DIR)
+
+
+def build_images(data, files):
+    try:
+        import PIL.Image  # noqa: F401
+    except ImportError:
+        print("Skipping responsive images: Pillow is not installed")
+        remove_image_variants()
+        return {}
+
+    images = list(BACKGROUND_IMAGES)
+    photo = data.get('about', {}).get('photo')
+    if photo:
+        images.append(photo)
+
+    results = {}
+    for image in images:
+        if image in files:
+            results[image] = image_variants(image, files)
+
+    remove_image_variants({v['src'] for result in results.values() for v in result['variants'][:-1]})
+
+    variants = sum(len(result['variants']) - 1 for result in results.values())
+    print(f"Responsive images: {len(results)} images, {variants} variants")
+    return results
+
+
+def image_attrs(image, sizes):
+    srcset = ', '.join(f"{v['src']} {v['width']}w" for v in image['variants'])
+    return (
+        f' decoding="async" height="{image["height"]}" loading="lazy"'
+        f' sizes="{escape_attr(sizes)}" srcset="{escape_attr(srcset)}" width="{image["width"]}"'
+    )
+
+
+# Swap a CSS background for the smallest variant that still covers the
+# viewport at 1x; the largest screens keep the stylesheet's original image
+def background_css(selector, image):
+    rules = []
+    for v in reversed(image['variants'][:-1]):
+        rules.append(
+            f"@media (max-width: {v['width']}px) and (max-height: {v['height']}px) "
+            f"{{ {selector} {{ background-image: url('{v['src']}'); }} }}"
+        )
+    return '\n'.join(rules)
+
+
+# --- ASSET FINGERPRINTING ---
+# With --fingerprint the stylesheets, scripts and images are copied to
+# assets/ under content-hashed names (assets/css/styles.<hash>.css) and
+# every reference in the compiled pages points at the copy. _headers marks
+# the copies immutable for hosts that read it (Netlify, Cloudflare Pages).
+
+ASSET_DIR = os.path.join(BASE_DIR, 'assets')
+HEADERS_FILE = os.path.join(BASE_DIR, '_headers')
+ASSET_PATTERNS = ['images/*.*', 'css/*.css', 'css/build/*.css', 'js/*.js', 'js/build/*.js']
+IMMUTABLE_CACHE_CONTROL = 'public, max-age=31536000, immutable'
+CSS_URL_PATTERN = re.compile(r'''url\((['"]?)([^'")]+)\1\)''')
+SOURCE_MAP_URL_PATTERN = re.compile(r'([#@] sourceMappingURL=)([^\s*]+)')
+
+
+def fingerprinted_path(name, content):
+    stem, ext = os.path.splitext(name)
+    return f'assets/{stem}.{sha256_bytes(content)[:10]}{ext}'
+
+
+# Point url() references in a stylesheet at the fingerprinted copies,
+# relative to the directory the stylesheet's copy ends up in
+def rewrite_css_urls(css, name, target_dir, assets):
+    def replace(match):
+        ref = match.group(2)
+        if '://' in ref or ref.startswith(('data:', '/')):
+            return match.group(0)
+        source = os.path.normpath(os.path.join(os.path.dirname(name), ref)).replace(os.sep, '/')
+        if source not in assets:
+            return match.group(0)
+        new_ref = os.path.relpath(assets[source], target_dir).replace(os.sep, '/')
+        return f'url({match.group(1)}{new_ref}{match.group(1)})'
+    return CSS_URL_PATTERN.sub(replace, css)
+
+
+# Write the fingerprinted copies and _headers; returns {name: copy}.
+# Images go first so the stylesheets can reference their copies.
+def build_assets(enabled):
+    assets = {}
+    if enabled:
+        for pattern in ASSET_PATTERNS:
+            for path in sorted(glob.glob(os.path.join(BASE_DIR, pattern))):
+                name = rel_path(path)
+                with open(path, 'rb') as f:
+                    content = f.read()
+                if name.endswith(('.css', '.js')):
+                    text = content.decode('utf-8')
+                    target_dir = os.path.dirname(f'assets/{name}')
+                    if name.endswith('.css'):
+                        text = rewrite_css_urls(text, name, target_dir, assets)
+                    # Source maps (--bundle) stay next to the original
+                    text = SOURCE_MAP_URL_PATTERN.sub(lambda m: m.group(1) + os.path.relpath(
+                        os.path.join(os.path.dirname(name), m.group(2)), target_dir).replace(os.sep, '/'), text)
+                    content = text.encode('utf-8')
+                assets[name] = fingerprinted_path(name, content)
+                write_if_changed(os.path.join(BASE_DIR, assets[name]), content)
+
+    # Copies of assets that changed or went away
+    keep = {os.path.join(BASE_DIR, copy) for copy in assets.values()}
+    for root, _, filenames in os.walk(ASSET_DIR, topdown=False):
+        for filename in filenames:
+            path = os.path.join(root, filename)
+            if re.sub(r'\.(gz|br)$', '', path) not in keep:
+                os.remove(path)
+        if not os.listdir(root):
+            os.rmdir(root)
+
+    if assets:
+        immutable = sorted(assets.values())
+        immutable += sorted(rel_path(path) for path in glob.glob(os.path.join(IMAGE_BUILD_DIR, '*')))
+        headers = ''.join(f'/{path}\n  Cache-Control: {IMMUTABLE_CACHE_CONTROL}\n' for path in immutable)
+        write_if_changed(HEADERS_FILE, headers.encode('utf-8'))
+        print(f"Fingerprinted {len(assets)} assets, {len(immutable)} immutable paths in _headers")
+    elif os.path.exists(HEADERS_FILE):
+        os.remove(HEADERS_FILE)
+    return assets
+
+
+def asset_pattern(assets):
+    names = sorted(assets, key=len, reverse=True)
+    return re.compile(r'(?<![\w/.-])(?:\./)?(' + '|'.join(re.escape(name) for name in names) + r')(?![\w/.-])')
+
+
+# Rewrite asset references in a stream of HTML. Text is only rewritten up
+# to the last '>' seen, so a tag or url() split across chunks is rewritten
+# once it is complete.
+def rewrite_asset_refs(chunks, assets):
+    if not assets:
+        yield from chunks
+        return
+    pattern = asset_pattern(assets)
+    replace = lambda match: assets[match.group(1)]
+    pending = ''
+    for chunk in chunks:
+        pending += chunk
+        cut = pending.rfind('>') + 1
+        if cut:
+            yield pattern.sub(replace, pending[:cut])
+            pending = pending[cut:]
+    yield pattern.sub(replace, pending)
+
+
+# --- CRITICAL CSS ---
+# With --critical-css the rules that the above-the-fold markup (navigation,
+# hero and about, everything before #techstack) can match are inlined in
+# <head>. The stylesheet itself loads without blocking render, as
+# css/build/styles.css with the rules nothing can match removed: selectors
+# naming a class or id that appears neither in the template nor as a word
+# in js/main.js or this compiler.
+
+CRITICAL_CSS_SOURCE = 'css/styles.css'
+CRITICAL_CSS_BUILD_FILE = os.path.join(CSS_DIR, 'build', 'styles.css')
+CRITICAL_CSS_CACHE_FILE = os.path.join(CACHE_DIR, 'critical-css.json')
+CRITICAL_FOLD_END = 'id="techstack"'
+CSS_COMMENT_PATTERN = re.compile(r'/\*.*?\*/', re.S)
+CSS_PSEUDO_PATTERN = re.compile(r'::?[\w-]+(\((?:[^()]|\([^()]*\))*\))?|\[[^\]]*\]')
+CSS_TAG_PATTERN = re.compile(r'(?:^|[\s>+~(])([a-zA-Z][\w-]*)')
+WORD_PATTERN = re.compile(r'[A-Za-z_][\w-]*')
+
+
+# Split a stylesheet into nodes:
+#   ('rule', selectors, body)       a style rule
+#   ('group', prelude, [nodes])     @media / @supports with nested rules
+#   ('at', prelude, body)           other block at-rules (@keyframes, ...)
+#   ('statement', text, None)       @import, @charset
+def parse_css(css):
+    nodes = []
+    start = i = 0
+    while i < len(css):
+        c = css[i]
+        if c in '"\'':
+            i = skip_css_string(css, i)
+        elif c == ';' and css[start:i].strip().startswith('@'):
+            nodes.append(('statement', css[start:i + 1].strip(), None))
+            start = i = i + 1
+        elif c == '{':
+            prelude = css[start:i].strip()
+            end = matching_brace(css, i)
+            body = css[i + 1:end]
+            if prelude.startswith(('@media', '@supports')):
+                nodes.append(('group', prelude, parse_css(body)))
+            elif prelude.startswith('@'):
+                nodes.append(('at', prelude, body.strip()))
+            else:
+                nodes.append(('rule', prelude, body.strip()))
+            start = i = end + 1
+        else:
+            i += 1
+    return nodes
+
+
+# Index just past the string literal starting at css[i]
+def skip_css_string(css, i):
+    end = css.find(css[i], i + 1)
+    return len(css) if end < 0 else end + 1
+
+
+def matching_brace(css, i):
+    depth = 0
+    while i < len(css):
+        c = css[i]
+        if c in '"\'':
+            i = skip_css_string(css, i)
+            continue
+        if c == '{':
+            depth += 1
+        elif c == '}':
+            depth -= 1
+            if depth == 0:
+                return i
+        i += 1
+    return len(css)
+
+
+def serialize_css(nodes, compact=False, indent=''):
+    out = []
+    for kind, prelude, body in nodes:
+        if kind == 'statement':
+            out.append(indent + prelude)
+        elif compact:
+            inner = serialize_css(body, True) if kind == 'group' else ' '.join(body.split())
+            out.append(f"{' '.join(prelude.split())}{{{inner}}}")
+        else:
+            inner = serialize_css(body, False, indent + '    ') if kind == 'group' else reindent_css(body, indent + '    ')
+            out.append(f'{indent}{prelude} {{\n{inner}\n{indent}}}')
+    return ''.join(out) if compact else '\n\n'.join(out)
+
+
+# One declaration per line at the given indent, nested blocks indented
+def reindent_css(body, indent):
+    lines = []
+    depth = 0
+    for line in body.splitlines():
+        line = line.strip()
+        if not line:
+            continue
+        if line.startswith('}'):
+            depth -= 1
+        lines.append(indent + '    ' * max(depth, 0) + line)
+        depth += line.count('{') - line.count('}') + (1 if line.startswith('}') else 0)
+    return '\n'.join(lines)
+
+
+# Tags, classes and ids a selector needs, ignoring pseudo-classes and
+# attribute selectors
+def selector_parts(selector):
+    selector = CSS_PSEUDO_PATTERN.sub('', selector)
+    return (
+        set(CSS_TAG_PATTERN.findall(selector)),
+        set(re.findall(r'\.([\w-]+)', selector)),
+        set(re.findall(r'#([\w-]+)', selector))
+    )
+
+
+def markup_tokens(html):
+    classes = set()
+    for value in re.findall(r'class="([^"]*)"', html):
+        classes.update(value.split())
+    return {
+        'tags': {tag.lower() for tag in re.findall(r'<([a-zA-Z][\w-]*)', html)},
+        'classes': classes,
+        'ids': set(re.findall(r'id="([^"]*)"', html))
+    }
+
+
+# Keep the rules whose selectors pass keep(selector); selector lists are
+# trimmed to the selectors that pass
+def filter_css(nodes, keep):
+    kept = []
+    for kind, prelude, body in nodes:
+        if kind == 'rule':
+            selectors = [sel.strip() for sel in prelude.split(',') if keep(sel.strip())]
+            if selectors:
+                kept.append((kind, ', '.join(selectors), body))
+        elif kind == 'group':
+            inner = filter_css(body, keep)
+            if inner:
+                kept.append((kind, prelude, inner))
+        else:
+            kept.append((kind, prelude, body))
+    return kept
+
+
+# Drop @import, and @keyframes no kept rule animates with
+def trim_critical(nodes, bodies):
+    kept = []
+    for kind, prelude, body in nodes:
+        if kind == 'statement':
+            continue
+        if kind == 'at' and prelude.startswith('@keyframes') and prelude.split()[-1] not in bodies:
+            continue
+        kept.append((kind, prelude, body))
+    return kept
+
+
+def rule_bodies(nodes):
+    return ' '.join(body if kind == 'rule' else rule_bodies(body) if kind == 'group' else '' for kind, _, body in nodes)
+
+
+# Move relative url()s from the stylesheet's directory to another one
+def relocate_css_urls(css, source_dir, target_dir):
+    def replace(match):
+        ref = match.group(2)
+        if '://' in ref or ref.startswith(('data:', '/')):
+            return match.group(0)
+        path = os.path.normpath(os.path.join(source_dir, ref))
+        new_ref = os.path.relpath(path, target_dir).replace(os.sep, '/')
+        return f'url({match.group(1)}{new_ref}{match.group(1)})'
+    return CSS_URL_PATTERN.sub(replace, css)
+
+
+def fold_html(template, slots):
+    html = ''
+    for chunk in template.stream(slots):
+        html += chunk
+        end = html.find(CRITICAL_FOLD_END)
+        if end >= 0:
+            return html[:html.rfind('<', 0, end)]
+    return html
+
+
+def critical_css(template, slots, files):
+    fold = markup_tokens(fold_html(template, slots))
+    key = sha256_json([
+        files.get(CRITICAL_CSS_SOURCE, {}).get('hash'), files.get(rel_path(TEMPLATE_FILE), {}).get('hash'),
+        files.get('js/main.js', {}).get('hash'), files.get('compile.py', {}).get('hash'),
+        sorted(fold['tags']), sorted(fold['classes']), sorted(fold['ids'])
+    ])
+    try:
+        with open(CRITICAL_CSS_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cached = json.load(f)
+        if cached['key'] == key:
+            count('critical_css.cache_hit')
+            return cached['critical'], cached['deferred']
+    except (OSError, ValueError, KeyError):
+        pass
+
+    with open(os.path.join(BASE_DIR, CRITICAL_CSS_SOURCE), 'r', encoding='utf-8') as f:
+        nodes = parse_css(CSS_COMMENT_PATTERN.sub('', f.read()))
+
+    # Everything the page can ever contain: the template, plus every word in
+    # the scripts and renderers that add classes and ids at runtime
+    page = markup_tokens(''.join(template.parts) + ''.join(v for v in template.defaults.values()))
+    words = set()
+    for path in (os.path.join(JS_DIR, 'main.js'), os.path.abspath(__file__)):
+        if os.path.exists(path):
+            with open(path, 'r', encoding='utf-8') as f:
+                words.update(WORD_PATTERN.findall(f.read()))
+
+    def used(selector):
+        _, classes, ids = selector_parts(selector)
+        return classes <= page['classes'] | words and ids <= page['ids'] | words
+
+    def above_fold(selector):
+        tags, classes, ids = selector_parts(selector)
+        tags.discard('html')
+        tags.discard('body')
+        return tags <= fold['tags'] and classes <= fold['classes'] and ids <= fold['ids']
+
+    deferred = filter_css(nodes, used)
+    critical = filter_css(deferred, above_fold)
+    critical = trim_critical(critical, rule_bodies(critical))
+
+    source_dir = os.path.dirname(CRITICAL_CSS_SOURCE)
+    critical_text = relocate_css_urls(serialize_css(critical, compact=True), source_dir, '.')
+    deferred_text = relocate_css_urls(serialize_css(deferred), source_dir, rel_path(os.path.dirname(CRITICAL_CSS_BUILD_FILE)))
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(CRITICAL_CSS_CACHE_FILE, 'w', encoding='utf-8') as f:
+        json.dump({'key': key, 'critical': critical_text, 'deferred': deferred_text}, f)
+    return critical_text, deferred_text
+
+
+# Write the trimmed stylesheet; returns the critical rules to inline
+def build_critical_css(template, slots, files):
+    critical, deferred = critical_css(template, slots, files)
+    write_if_changed(CRITICAL_CSS_BUILD_FILE, deferred.encode('utf-8'))
+    with open(os.path.join(BASE_DIR, CRITICAL_CSS_SOURCE), 'rb') as f:
+        original = len(f.read())
+    print(f"Critical CSS: {len(critical.encode('utf-8'))} bytes inline, deferred {rel_path(CRITICAL_CSS_BUILD_FILE)} "
+          f"{len(deferred.encode('utf-8'))} of {original} bytes")
+    return critical
+
+
+# Link the stylesheet, or with critical rules inline them and load the
+# stylesheet without blocking render (the noscript link covers browsers
+# without JS)
+def stylesheet_tags(href, critical=None):
+    if critical is None:
+        return f'<link href="{href}" rel="stylesheet"/>'
+    return (
+        f'<style>{critical}</style>'
+        f'<link as="style" href="{href}" onload="this.onload=null;this.rel=\'stylesheet\'" rel="preload"/>'
+        f'<noscript><link href="{href}" rel="stylesheet"/></noscript>'
+    )
+
+
+# --- BUNDLING ---
+# With --bundle the page loads one script and one stylesheet, each with a
+# source map: js/build/bundle.js is js/config.js and js/main.js with every
+# config value main.js never reassigns inlined as a literal, and
+# css/build/bundle.css is the stylesheet the page would otherwise link.
+# Minifying only drops comments, indentation and blank lines, so every
+# output line starts at a known source position. The data main.js would
+# fetch from data/*.json is embedded in the page instead, and the fetch
+# path (between the @bundle-strip markers) is left out of the bundle.
+
+BUNDLE_JS_SOURCES = ['js/config.js', 'js/main.js']
+BUNDLE_JS_FILE = os.path.join(JS_DIR, 'build', 'bundle.js')
+BUNDLE_CSS_FILE = os.path.join(CSS_DIR, 'build', 'bundle.css')
+BUNDLE_DATA = ['about', 'techstack', 'projects', 'research', 'achievements', 'certifications', 'experience', 'education']
+BUNDLE_STRIP_PATTERN = re.compile(r'^[ \t]*// @bundle-strip-start\n.*?^[ \t]*// @bundle-strip-end\n', re.S | re.M)
+CONFIG_DECLARATION_PATTERN = re.compile(r'\bconst\s+config\s*=\s*(\{.*\})\s*;?\s*$', re.S)
+CONFIG_REF_PATTERN = re.compile(r'(?<![\w$.])config((?:\.[A-Za-z_$][\w$]*)+)')
+CONFIG_ASSIGN_PATTERN = re.compile(
+    r'(?<![\w$.])config((?:\.[A-Za-z_$][\w$]*)+)\s*(?:(?:[-+*/%&|^]|\*\*|<<|>>>?|&&|\|\||\?\?)?=(?!=)|\+\+|--)'
+)
+# After these a '/' starts a regular expression rather than a division
+REGEX_PRECEDERS = set('(,=:[!&|?{};+-*%<>~^')
+REGEX_KEYWORDS = {'return', 'typeof', 'case', 'do', 'else', 'in', 'of', 'new', 'delete', 'void', 'throw', 'yield', 'await'}
+BASE64_DIGITS = 'ABCDEFGHIJKLMNOPQRSTUVWXYZabcdefghijklmnopqrstuvwxyz0123456789+/'
+
+
+# Remove the comments from a script (js=True) or stylesheet. Line breaks
+# are kept so line numbers still match the source. Returns the code and the
+# numbers of the lines that start inside a string or template literal,
+# whose whitespace has to stay as it is.
+def strip_comments(source, js=True):
+    out = []
+    verbatim = set()
+    line = [0]
+    n = len(source)
+
+    def emit(text, literal=False):
+        for _ in range(text.count('\n')):
+            line[0] += 1
+            if literal:
+                verbatim.add(line[0])
+        out.append(text)
+
+    def string_end(i):
+        quote = source[i]
+        i += 1
+        while i < n and source[i] != quote:
+            i += 2 if source[i] == '\\' else 1
+        return i + 1
+
+    def regex_end(i):
+        i += 1
+        in_class = False
+        while i < n:
+            c = source[i]
+            if c == '\\':
+                i += 1
+            elif c == '[':
+                in_class = True
+            elif c == ']':
+                in_class = False
+            elif c == '/' and not in_class:
+                break
+            i += 1
+        i += 1
+        while i < n and source[i].isalpha():
+            i += 1
+        return i
+
+    # Template literal: the text is copied as is, ${...} is code again
+    def template(i):
+        start = i
+        i += 1
+        while i < n and source[i] != '`':
+            if source[i] == '\\':
+                i += 2
+            elif source.startswith('${', i):
+                emit(source[start:i + 2], True)
+                i = code(i + 2, nested=True)
+                start = i
+                i += 1
+            else:
+                i += 1
+        emit(source[start:i + 1], True)
+        return i + 1
+
+    # Code up to the end, or up to the '}' closing a ${...}
+    def code(i, nested=False):
+        depth = 0
+        prev = ''
+        word = False
+        start = i
+        while i < n:
+            c = source[i]
+            if c == '/' and i + 1 < n and source[i + 1] in '/*' and (js or source[i + 1] == '*'):
+                emit(source[start:i])
+                if source[i + 1] == '/':
+                    end = source.find('\n', i)
+                    end = n if end < 0 else end
+                else:
+                    end = source.find('*/', i + 2)
+                    end = n if end < 0 else end + 2
+                    emit('\n' * source.count('\n', i, end) or ' ')
+                i = start = end
+                continue
+            if c in '"\'' or (js and c in '`/'):
+                if c == '/' and not (prev in REGEX_PRECEDERS or prev in REGEX_KEYWORDS or prev == ''):
+                    i += 1
+                    prev, word = c, False
+                    continue
+                emit(source[start:i])
+                if c == '`':
+                    i = template(i)
+                else:
+                    end = string_end(i) if c != '/' else regex_end(i)
+                    emit(source[i:end], c != '/')
+                    i = end
+                start = i
+                prev, word = 'literal', False
+                continue
+            if nested and c == '{':
+                depth += 1
+            elif nested and c == '}':
+                if not depth:
+                    emit(source[start:i])
+                    return i
+                depth -= 1
+            if c.isalnum() or c in '_$':
+                prev = prev + c if word else c
+                word = True
+            elif c.isspace():
+                word = False
+            else:
+                prev, word = c, False
+            i += 1
+        emit(source[start:i])
+        return i
+
+    code(0)
+    return ''.join(out), verbatim
+
+
+# Drop indentation, trailing whitespace and blank lines outside literals.
+# Yields (text, line, column of the text in the source line).
+def minify_lines(code, verbatim):
+    for number, text in enumerate(code.split('\n')):
+        column = 0
+        if number not in verbatim:
+            stripped = text.lstrip()
+            column = len(text) - len(stripped)
+            text = stripped
+        if number + 1 not in verbatim:
+            text = text.rstrip()
+        if text or number in verbatim:
+            yield text, number, column
+
+
+# The object literal assigned to config in js/config.js, or None when it
+# is not plain JSON once its keys are quoted
+def config_values(code):
+    match = CONFIG_DECLARATION_PATTERN.search(code)
+    if not match:
+        return None
+    literal = re.sub(r'([{,]\s*)([A-Za-z_$][\w$]*)\s*:', r'\1"\2":', match.group(1))
+    literal = re.sub(r',(\s*[}\]])', r'\1', literal)
+    try:
+        return json.loads(literal)
+    except ValueError:
+        return None
+
+
+# Replace config.a.b with its value where it is a string, number or
+# boolean that no script assigns to
+def inline_config(code, config, assigned):
+    def replace(match):
+        path = tuple(match.group(1)[1:].split('.'))
+        value = config
+        for key in path:
+            if not isinstance(value, dict) or key not in value:
+                return match.group(0)
+            value = value[key]
+        if isinstance(value, (dict, list)) or any(path[:len(a)] == a or a[:len(path)] == path for a in assigned):
+            return match.group(0)
+        count('bundle.inlined')
+        return json.dumps(value)
+    return CONFIG_REF_PATTERN.sub(replace, code)
+
+
+def vlq(value):
+    value = (-value << 1) | 1 if value < 0 else value << 1
+    digits = ''
+    while True:
+        digit = value & 31
+        value >>= 5
+        digits += BASE64_DIGITS[digit | 32 if value else digit]
+        if not value:
+            return digits
+
+
+# Source map v3 with one segment per output line: [(source, line, column)]
+def source_map(file, sources, mapping):
+    segments = []
+    previous = (0, 0, 0)
+    for position in mapping:
+        segments.append('A' + ''.join(vlq(now - before) for now, before in zip(position, previous)))
+        previous = position
+    return json.dumps({'version': 3, 'file': file, 'sources': sources, 'names': [], 'mappings': ';'.join(segments)})
+
+
+# Write target and target.map from [(source name, code, verbatim lines)]
+def write_bundle(target, parts, js):
+    lines = []
+    mapping = []
+    for index, (_, code, verbatim) in enumerate(parts):
+        for text, line, column in minify_lines(code, verbatim):
+            lines.append(text)
+            mapping.append((index, line, column))
+    target_dir = os.path.dirname(rel_path(target))
+    sources = [os.path.relpath(name, target_dir).replace(os.sep, '/') for name, _, _ in parts]
+    map_name = os.path.basename(target) + '.map'
+    lines.append(f'//# sourceMappingURL={map_name}' if js else f'/*# sourceMappingURL={map_name} */')
+    content = ('\n'.join(lines) + '\n').encode('utf-8')
+    write_if_changed(target, content)
+    write_if_changed(target + '.map', source_map(os.path.basename(target), sources, mapping).encode('utf-8'))
+    return len(content)
+
+
+def bundle_js():
+    sources = {}
+    for name in BUNDLE_JS_SOURCES:
+        with open(os.path.join(BASE_DIR, name), 'r', encoding='utf-8') as f:
+            # Blank out the stripped region line for line, keeping the map exact
+            sources[name] = BUNDLE_STRIP_PATTERN.sub(lambda m: '\n' * m.group(0).count('\n'), f.read())
+    parts = [(name, *strip_comments(source)) for name, source in sources.items()]
+
+    config = config_values(parts[0][1]) or {}
+    assigned = {tuple(m.group(1)[1:].split('.')) for _, code, _ in parts for m in CONFIG_ASSIGN_PATTERN.finditer(code)}
+    parts = [parts[0]] + [(name, inline_config(code, config, assigned), verbatim) for name, code, verbatim in parts[1:]]
+
+    size = write_bundle(BUNDLE_JS_FILE, parts, js=True)
+    original = sum(len(source.encode('utf-8')) for source in sources.values())
+    print(f"Bundle: {rel_path(BUNDLE_JS_FILE)} {size} of {original} bytes, "
+          f"{counts.get('bundle.inlined', 0)} config references inlined")
+    return rel_path(BUNDLE_JS_FILE)
+
+
+def bundle_css(stylesheet):
+    with open(os.path.join(BASE_DIR, stylesheet), 'r', encoding='utf-8') as f:
+        source = f.read()
+    code, verbatim = strip_comments(source, js=False)
+    code = relocate_css_urls(code, os.path.dirname(stylesheet), rel_path(os.path.dirname(BUNDLE_CSS_FILE)))
+    size = write_bundle(BUNDLE_CSS_FILE, [(stylesheet, code, verbatim)], js=False)
+    print(f"Bundle: {rel_path(BUNDLE_CSS_FILE)} {size} of {len(source.encode('utf-8'))} bytes")
+    return rel_path(BUNDLE_CSS_FILE)
+
+
+# The data as main.js would have fetched it, safe inside a <script>
+def prerendered_data(data):
+    payload = json.dumps({name: data.get(name) for name in BUNDLE_DATA}, ensure_ascii=False, separators=(',', ':'))
+    payload = payload.replace('</', '<\\/')
+    return f'<script id="portfolio-data" type="application/json">{payload}</script>'
+
+
+# Remove a generated file, its compressed copies and its directory once empty
+def remove_build_file(path):
+    for name in [path] + compressed_copies(path):
+        if os.path.exists(name):
+            os.remove(name)
+    directory = os.path.dirname(path)
+    if os.path.isdir(directory) and not os.listdir(directory):
+        os.rmdir(directory)
+
+
+# --- ARCHIVE ---
+# With --archive, archive.zip is read through its central directory: zipfile
+# inflates nothing until an entry is opened. archive/manifest.json lists
+# every entry with its sizes, CRC-32 and SHA-256. The old sites named in
+# ARCHIVE_PROJECTS are extracted entry by entry under archive/, so each file
+# is served (and, with --compress, precompressed) on its own. An entry is
+# only inflated again when its CRC or size changes.
+
+ARCHIVE_FILE = os.path.join(BASE_DIR, 'archive.zip')
+ARCHIVE_DIR = os.path.join(BASE_DIR, 'archive')
+ARCHIVE_MANIFEST_FILE = os.path.join(ARCHIVE_DIR, 'manifest.json')
+ARCHIVE_CACHE_FILE = os.path.join(CACHE_DIR, 'archive.json')
+# Static sites that work as they are; the Vite project needs a build first
+ARCHIVE_PROJECTS = ['archive/classic/']
+
+
+def entry_chunks(archive, info, digest):
+    with archive.open(info) as f:
+        for block in iter(lambda: f.read(STREAM_BLOCK_SIZE), b''):
+            digest.update(block)
+            yield block
+
+
+# Where an entry is published, or None. The name is normalised before the
+# ARCHIVE_PROJECTS check, so names that would land outside a published
+# project ('archive/classic/../../compile.py') are never extracted.
+def archive_target(name):
+    path = os.path.normpath(name).replace(os.sep, '/')
+    if os.path.isabs(path) or not path.startswith(tuple(ARCHIVE_PROJECTS)):
+        return None
+    return os.path.join(BASE_DIR, path)
+
+
+# Remove everything under archive/ except the files in keep
+def clean_archive(keep):
+    keep = set(keep)
+    for path in list(keep):
+        keep.update(compressed_copies(path))
+    for root, _, filenames in os.walk(ARCHIVE_DIR, topdown=False):
+        for filename in filenames:
+            path = os.path.join(root, filename)
+            if path not in keep:
+                os.remove(path)
+        if not os.listdir(root):
+            os.rmdir(root)
+
+
+def build_archive():
+    import zipfile
+    try:
+        with open(ARCHIVE_CACHE_FILE, 'r', encoding='utf-8') as f:
+            cache = json.load(f)
+    except (OSError, ValueError):
+        cache = {}
+
+    entries = []
+    published = []
+    inflated = 0
+    with zipfile.ZipFile(ARCHIVE_FILE) as archive:
+        for info in archive.infolist():
+            if info.is_dir():
+                continue
+            target = archive_target(info.filename)
+            cached = cache.get(info.filename)
+            if cached and cached[:2] == [info.CRC, info.file_size] and (not target or os.path.exists(target)):
+                sha = cached[2]
+            else:
+                digest = hashlib.sha256()
+                chunks = entry_chunks(archive, info, digest)
+                if target:
+                    os.makedirs(os.path.dirname(target), exist_ok=True)
+                    write_atomic(target, chunks, binary=True)
+                else:
+                    for _ in chunks:
+                        pass
+                sha = digest.hexdigest()
+                cache[info.filename] = [info.CRC, info.file_size, sha]
+                inflated += 1
+            entry = {'name': info.filename, 'size': info.file_size, 'compressed': info.compress_size,
+                     'crc32': f'{info.CRC:08x}', 'sha256': sha}
+            if target:
+                entry['url'] = rel_path(target)
+                published.append(target)
+            entries.append(entry)
+
+    names = {entry['name'] for entry in entries}
+    cache = {name: value for name, value in cache.items() if name in names}
+    os.makedirs(CACHE_DIR, exist_ok=True)
+    with open(ARCHIVE_CACHE_FILE, 'w', encoding='utf-8') as f:
+        json.dump(cache, f)
+
+    manifest = {'source': rel_path(ARCHIVE_FILE), 'size': os.path.getsize(ARCHIVE_FILE), 'entries': entries}
+    os.makedirs(ARCHIVE_DIR, exist_ok=True)
+    write_atomic(ARCHIVE_MANIFEST_FILE, [json.dumps(manifest, separators=(',', ':'))])
+    clean_archive(published + [ARCHIVE_MANIFEST_FILE])
+    print(f"Archive: {len(entries)} entries in {rel_path(ARCHIVE_MANIFEST_FILE)}, "
+          f"{len(published)} published, {inflated} inflated")
+
+
+# --- PAGE BUDGETS ---
+# With --budget [CONFIG] every build measures its artifacts (raw, gzip and,
+# when brotli is installed, brotli bytes), the element count of index.html
+# and of each of its sections, and the largest detail fragments. These are
+# checked against the limits in CONFIG (budgets.json by default):
+#
+#   {"history": "budget-history.jsonl",
+#    "artifacts": {"index.html": {"raw": 400000, "gzip": 80000}},
+#    "page": {"nodes": 3000},
+#    "sections": {"projects": {"nodes": 600, "bytes": 150000}, "*": {"nodes": 400}},
+#    "detail": {"bytes": 24000}}
+#
+# "*" applies to sections without their own entry. The build fails with a
+# per-section report when a limit is exceeded. Measurements are appended to
+# the history file whenever they change, dated with the source date, so an
+# unchanged build adds nothing.
+
+BUDGET_ARTIFACTS = ['index.html', 'search-index.json', 'llms.txt', 'llms-full.txt', 'sitemap.xml',
+                    'css/styles.css', 'js/main.js', 'css/build/bundle.css', 'js/build/bundle.js']
+BUDGET_TOP_DETAILS = 5
+VOID_ELEMENTS = frozenset('area base br col embed hr img input link meta param source track wbr'.split())
+
+
+class BudgetError(Exception):
+    def __init__(self, failures):
+        super().__init__('\n'.join(failures))
+        self.failures = failures
+
+
+def artifact_sizes(path):
+    with open(path, 'rb') as f:
+        content = f.read()
+    sizes = {'raw': len(content), 'gzip': len(gzip.compress(content, compresslevel=9, mtime=0))}
+    if brotli:
+        sizes['brotli'] = len(brotli.compress(content, quality=11))
+    return sizes
+
+
+# Element counts for the page and each <section id>, each section's bytes,
+# and the size of every embedded detail-content block with its card's id
+def page_stats(html):
+    from html.parser import HTMLParser
+    line_starts = [0] + [m.end() for m in re.finditer('\n', html)]
+    stats = {'nodes': 0, 'sections': {}, 'details': []}
+
+    class StatsParser(HTMLParser):
+        def __init__(self):
+            super().__init__(convert_charrefs=False)
+            self.stack = []
+            self.section = None
+            self.card = None
+
+        def position(self):
+            line, column = self.getpos()
+            return line_starts[line - 1] + column
+
+        def handle_starttag(self, tag, attrs):
+            attrs = dict(attrs)
+            classes = (attrs.get('class') or '').split()
+            stats['nodes'] += 1
+            entry = [tag, None, None]
+            if tag == 'section' and attrs.get('id') and self.section is None:
+                self.section = attrs['id']
+                stats['sections'][self.section] = {'nodes': 0, 'bytes': 0}
+                entry[1] = self.position()
+            if self.section:
+                stats['sections'][self.section]['nodes'] += 1
+            if 'card' in classes and attrs.get('id'):
+                self.card = attrs['id']
+            if 'detail-content' in classes:
+                entry[2] = self.position()
+            if tag not in VOID_ELEMENTS:
+                self.stack.append(entry)
+
+        def handle_endtag(self, tag):
+            for i in range(len(self.stack) - 1, -1, -1):
+                if self.stack[i][0] == tag:
+                    break
+            else:
+                return
+            _, section_start, detail_start = self.stack[i]
+            del self.stack[i:]
+            end = self.position() + len(f'</{tag}>')
+            if section_start is not None:
+                stats['sections'][self.section]['bytes'] = len(html[section_start:end].encode('utf-8'))
+                self.section = None
+            if detail_start is not None:
+                stats['details'].append([self.card, len(html[detail_start:end].encode('utf-8'))])
+
+    parser = StatsParser()
+    parser.feed(html)
+    parser.close()
+    return stats
+
+
+def measure_budgets():
+    metrics = {'artifacts': {}}
+    for name in BUDGET_ARTIFACTS:
+        path = os.path.join(BASE_DIR, name)
+        if os.path.exists(path):
+            metrics['artifacts'][name] = artifact_sizes(path)
+    with open(OUTPUT_FILE, 'r', encoding='utf-8') as f:
+        stats = page_stats(f.read())
+    metrics['nodes'] = stats['nodes']
+    metrics['sections'] = stats['sections']
+    # Fragments written by --lazy-details count as detail fragments too
+    details = stats['details']
+    for path in glob.glob(os.path.join(DETAIL_BUILD_DIR, '**', '*.html'), recursive=True):
+        details.append([rel_path(path), os.path.getsize(path)])
+    metrics['details'] = sorted(details, key=lambda d: -d[1])[:BUDGET_TOP_DETAILS]
+    return metrics
+
+
+def check_budgets(metrics, budgets):
+    failures = []
+    for name, limits in budgets.get('artifacts', {}).items():
+        measured = metrics['artifacts'].get(name, {})
+        for kind, limit in limits.items():
+            if measured.get(kind, 0) > limit:
+                failures.append(f"{name}: {kind} {measured[kind]} > {limit} bytes")
+    page_limit = budgets.get('page', {}).get('nodes')
+    if page_limit is not None and metrics['nodes'] > page_limit:
+        failures.append(f"index.html: {metrics['nodes']} elements > {page_limit}")
+    section_budgets = budgets.get('sections', {})
+    for section, measured in metrics['sections'].items():
+        limits = section_budgets.get(section, section_budgets.get('*', {}))
+        if measured['nodes'] > limits.get('nodes', measured['nodes']):
+            failures.append(f"#{section}: {measured['nodes']} elements > {limits['nodes']}")
+        if measured['bytes'] > limits.get('bytes', measured['bytes']):
+            failures.append(f"#{section}: {measured['bytes']} bytes > {limits['bytes']}")
+    detail_limit = budgets.get('detail', {}).get('bytes')
+    for card, size in metrics['details']:
+        if detail_limit is not None and size > detail_limit:
+            failures.append(f"detail {card}: {size} bytes > {detail_limit}")
+    return failures
+
+
+def print_budget_report(metrics, budgets):
+    print("-" * 30)
+    print("Page Budget:")
+    for name, sizes in metrics['artifacts'].items():
+        print(f"{name}: " + ', '.join(f"{kind} {size}" for kind, size in sizes.items()))
+    total = sum(section['bytes'] for section in metrics['sections'].values()) or 1
+    section_budgets = budgets.get('sections', {})
+    print(f"index.html: {metrics['nodes']} elements")
+    print(f"{'section':<16}{'elements':>10}{'limit':>8}{'bytes':>10}{'limit':>9}{'share':>7}")
+    for section, measured in sorted(metrics['sections'].items(), key=lambda s: -s[1]['bytes']):
+        limits = section_budgets.get(section, section_budgets.get('*', {}))
+        print(f"#{section:<15}{measured['nodes']:>10}{limits.get('nodes', '-'):>8}"
+              f"{measured['bytes']:>10}{limits.get('bytes', '-'):>9}{measured['bytes'] / total:>7.0%}")
+    if metrics['details']:
+        print("Largest detail fragments: " + ', '.join(f"{card} {size}" for card, size in metrics['details']))
+    print("-" * 30)
+
+
+# Append the measurements to the history file unless they match its last line
+def record_budget_history(path, metrics, updated):
+    last = None
+    if os.path.exists(path):
+        with open(path, 'rb') as f:
+            lines = f.read().splitlines()
+        if lines:
+            try:
+                last = json.loads(lines[-1]).get('metrics')
+            except ValueError:
+                pass
+    if last != metrics:
+        with open(path, 'a', encoding='utf-8') as f:
+            f.write(json.dumps({'date': updated.isoformat(), 'metrics': metrics}, separators=(',', ':')) + '\n')
+
+
+# Returns the exceeded limits, an empty list when everything fits
+def enforce_budgets(config, updated):
+    path = os.path.join(BASE_DIR, config)
+    budgets = {}
+    if os.path.exists(path):
+        with open(path, 'r', encoding='utf-8') as f:
+            budgets = json.load(f)
+    else:
+        print(f"{config} not found, measuring only")
+    metrics = measure_budgets()
+    print_budget_report(metrics, budgets)
+    if budgets.get('history'):
+        record_budget_history(os.path.join(BASE_DIR, budgets['history']), metrics, updated)
+    return check_budgets(metrics, budgets)
+
+
+# --- COMPRESSION ---
+# Every text artifact gets a .gz (and .br when brotli is installed) copy at
+# maximum level, for hosts that serve precompressed files directly.
+
+COMPRESS_PATTERNS = [
+    'index.html', 'sitemap.xml', 'sitemap-*.xml', 'llms*.txt', 'search-index.json', 'css/*.css', 'js/*.js',
+    'data/*.json', 'details/**/*.md', 'details/build/**/*.html', 'css/build/*.css', 'js/build/*.js',
+    'css/build/*.map', 'js/build/*.map', 'assets/**/*.css', 'assets/**/*.js', 'archive/**/*.json',
+    'archive/**/*.html', 'archive/**/*.css', 'archive/**/*.js'
+] + [f'{section}/**/index.html' for section in STATIC_PAGE_SECTIONS]
+
+
+def compressed_copies(path):
+    return [path + '.gz'] + ([path + '.br'] if brotli else [])
+
+
+# Write the compressed copies of content next to path. gzip mtime is pinned
+# so unchanged input gives byte-identical output.
+def precompress(path, content):
+    sizes = {'raw': len(content)}
+    gz = gzip.compress(content, compresslevel=9, mtime=0)
+    write_if_changed(path + '.gz', gz)
+    sizes['gz'] = len(gz)
+    if brotli:
+        br = brotli.compress(content, quality=11)
+        write_if_changed(path + '.br', br)
+        sizes['br'] = len(br)
+    return sizes
+
+
+def compress_file(path):
+    with open(path, 'rb') as f:
+        return precompress(path, f.read())
+
+
+# Remove the .gz/.br copies of COMPRESS_PATTERNS outputs whose source is not
+# in keep: gone, or not compressed by this build. A .br is stale too once
+# brotli is no longer installed, since nothing would refresh it.
+def remove_compressed_copies(keep):
+    copies = set()
+    for pattern in COMPRESS_PATTERNS:
+        for suffix in ('.gz', '.br'):
+            copies.update(glob.glob(os.path.join(BASE_DIR, pattern + suffix), recursive=True))
+    removed = 0
+    for copy in sorted(copies):
+        source = os.path.splitext(copy)[0]
+        if source not in keep or copy not in compressed_copies(source):
+            os.remove(copy)
+            removed += 1
+    return removed
+
+
+def compress_outputs(manifest, jobs):
+    paths = []
+    for pattern in COMPRESS_PATTERNS:
+        paths += sorted(glob.glob(os.path.join(BASE_DIR, pattern), recursive=True))
+
+    previous = manifest.get('compressed', {})
+    entries = {}
+    pending = []
+    for path in paths:
+        entry = hash_file(path, previous)
+        entries[rel_path(path)] = entry
+        old = previous.get(rel_path(path))
+        if old and old['hash'] == entry['hash'] and all(os.path.exists(p) for p in compressed_copies(path)):
+            continue
+        pending.append(path)
+
+    # zlib and brotli release the GIL while compressing, so threads are enough
+    from concurrent.futures import ThreadPoolExecutor
+    with ThreadPoolExecutor(max_workers=jobs) as pool:
+        results = list(pool.map(compress_file, pending))
+
+    manifest['compressed'] = entries
+    removed = remove_compressed_copies(set(paths))
+
+    print("-" * 30)
+    print(f"Compression: {len(pending)} of {len(paths)} files updated, {removed} stale copies removed")
+    for path, sizes in zip(pending, results):
+        line = f"{rel_path(path)}: {sizes['raw']} -> {sizes['gz']} gz"
+        if 'br' in sizes:
+            line += f", {sizes['br']} br"
+        print(line)
+
+    totals = {'raw': 0, 'gz': 0, 'br': 0}
+    for path in paths:
+        totals['raw'] += os.path.getsize(path)
+        totals['gz'] += os.path.getsize(path + '.gz')
+        if brotli:
+            totals['br'] += os.path.getsize(path + '.br')
+    summary = f"Total: {totals['raw']} raw, {totals['gz']} gz"
+    if brotli:
+        summary += f", {totals['br']} br"
+    else:
+        summary += " (install brotli for .br files)"
+    print(summary)
+    print("-" * 30)
+
+
+# --- INDEX.HTML ---
+
+# The footer timestamp is in IST. zoneinfo needs the system tz database
+# (or the tzdata package); India has no DST, so a fixed offset is the same
+# clock where neither is available.
+def india_timezone():
+    try:
+        from zoneinfo import ZoneInfo
+        return ZoneInfo('Asia/Kolkata')
+    except (ImportError, KeyError):
+        return timezone(timedelta(hours=5, minutes=30), 'IST')
+
+
+def build_index(data, cache, template, jobs=1, compact=False, images=None, page_template=None,
+                fingerprint=False, critical=False, files=None, bundle=False, updated=None):
+    slots = {}
+    images = images or {}
+    updated = updated or datetime.now(timezone.utc)
+
+    if jobs > 1:
+        with phase('Prerender cards'):
+            prerender_cards(cache, data, jobs)
+
+    # --- SECTIONS ---
+
+    # 1. Hero
+    with phase('1. Hero'):
+        if 'about' in data:
+            about = data['about']
+            slots['hero-name'] = escape(about.get('name', ''))
+            slots['hero-tagline'] = escape(about.get('tagline', ''))
+
+            if about.get('resume'):
+                slots['resume-link.href'] = escape_attr(about['resume'])
+
+            if about.get('email'):
+                email = escape(about['email'])
+                slots['hero-email'] = f'<a class="hero-email-link" href="mailto:{escape_attr(about["email"])}">{email}</a>'
+
+    # 2. About
+    with phase('2. About'):
+        if 'about' in data:
+            about = data['about']
+            slots['profile-photo.src'] = escape_attr(about.get('photo', ''))
+            slots['profile-photo.alt'] = escape_attr(f"{about.get('name', '')} Profile Photo")
+            if about.get('photo') in images:
+                slots['profile-photo.attrs'] = image_attrs(images[about['photo']], PROFILE_PHOTO_SIZES)
+            slots['bio-text'] = escape(about.get('bio', ''))
+
+            if about.get('socials'):
+                icon_map = {
+                    'github': 'fa-brands fa-github',
+                    'linkedin': 'fa-brands fa-linkedin',
+                    'twitter': 'fa-brands fa-x-twitter'
+                }
+                not_to_display = ["discord", "instagram"]
+
+                social_links = ''
+                for platform, url in about['socials'].items():
+                    if url and platform not in not_to_display:
+                        if platform in icon_map:
+                            social_links += render_social_link(platform, url, icon_map[platform], 'social-link')
+                        else:
+                            social_links += link(url, escape(platform.capitalize()), 'class="social-link" ')
+                slots['social-links'] = social_links
+
+    # 3. Tech Stack
+    with phase('3. Tech Stack'):
+        if 'techstack' in data:
+            slots['techstack-content'] = render_section(cache, 'techstack', data['techstack'])
+
+    # 4. Projects
+    with phase('4. Projects'):
+        if 'projects' in data:
+            slots['projects-content'] = render_section(cache, 'projects', data['projects'])
+
+    # 5. Research
+    with phase('5. Research'):
+        if 'research' in data:
+            # Google Scholar Link
+            if 'about' in data and 'googleScholar' in data['about']:
+                slots['google-scholar-link.href'] = escape_attr(data['about']['googleScholar'])
+            slots['research-content'] = render_section(cache, 'research', data['research'])
+
+    # 6. Achievements
+    with phase('6. Achievements'):
+        if 'achievements' in data:
+            slots['achievements-content'] = render_section(cache, 'achievements', data['achievements'])
+
+    # 7. Experience
+    with phase('7. Experience'):
+        if 'experience' in data:
+            slots['experience-content'] = render_section(cache, 'experience', data['experience'])
+
+    # 8. Certifications
+    with phase('8. Certifications'):
+        if 'certifications' in data:
+            slots['certifications-content'] = render_section(cache, 'certifications', data['certifications'])
+
+    # 9. Profiles
+    with phase('9. Profiles'):
+        if 'about' in data and 'codingProfiles' in data['about']:
+            profiles_map = [
+                {'name': 'LeetCode', 'key': 'leetcode'},
+                {'name': 'Codeforces', 'key': 'codeforces'},
+                {'name': 'CodeChef', 'key': 'codechef'}
+            ]
+            profiles = []
+            for profile in profiles_map:
+                url = data['about']['codingProfiles'].get(profile['key'])
+                if url:
+                    profiles.append({'name': profile['name'], 'url': url})
+            slots['profiles-content'] = render_section(cache, 'profiles', profiles)
+
+    # 10. Education
+    with phase('10. Education'):
+        if 'education' in data:
+            slots['education-content'] = render_section(cache, 'education', data['education'])
+
+    # 11. Contact
+    with phase('11. Contact'):
+        if 'about' in data:
+            about = data['about']
+            if about.get('email'):
+                email = escape(about['email'])
+                slots['contact-email'] = f'<a class="email-link" href="mailto:{escape_attr(about["email"])}">{email}</a>'
+
+            if about.get('socials'):
+                icon_map = {
+                    'github': 'fa-brands fa-github',
+                    'linkedin': 'fa-brands fa-linkedin',
+                    'twitter': 'fa-brands fa-x-twitter',
+                    'instagram': 'fa-brands fa-instagram',
+                    'discord': 'fa-brands fa-discord'
+                }
+                contact_links = ''
+                for platform, url in about['socials'].items():
+                    if url and platform in icon_map:
+                        contact_links += render_social_link(platform, url, icon_map[platform], 'contact-social-link')
+                slots['contact-social'] = contact_links
+
+    # 12. Footer
+    with phase('12. Footer'):
+        if 'about' in data:
+            slots['footer-name'] = escape(data['about'].get('name', ''))
+
+            if 'socials' in data['about']:
+                socials = data['about']['socials']
+                social_links = {
+                    'github-link': socials.get('github'),
+                    'linkedin-link': socials.get('linkedin'),
+                    'twitter-link': socials.get('twitter'),
+                    'instagram-link': socials.get('instagram'),
+                    'discord-link': socials.get('discord')
+                }
+                for id_val, url in social_links.items():
+                    if url:
+                        slots[f'{id_val}.href'] = escape_attr(url)
+
+            # Add Last Updated: when the sources last changed, not when
+            # this build ran
+            now = updated.astimezone(india_timezone())
+            # Format: Last Update on 28/11/2025 11:41 pm IST
+            timestamp_str = now.strftime("Last Update on %d/%m/%Y %I:%M %p IST")
+            slots['footer-updated'] = f'<p>{timestamp_str}</p>'
+
+    # 13. Skeleton classes are toggled once, when the template is compiled
+
+    # Responsive background images
+    background_rules = [background_css(BACKGROUND_IMAGES[image], images[image]) for image in BACKGROUND_IMAGES if image in images]
+    if background_rules:
+        slots['head-extra'] = '<style>\n' + '\n'.join(background_rules) + '\n</style>'
+
+    with phase('Detail fragments'):
+        if render_options['lazy_details']:
+            write_detail_fragments(data)
+        else:
+            remove_detail_fragments()
+
+    stylesheet = CRITICAL_CSS_SOURCE
+    inline_css = None
+    with phase('Critical CSS'):
+        if critical:
+            inline_css = build_critical_css(template, slots, files or {})
+            stylesheet = rel_path(CRITICAL_CSS_BUILD_FILE)
+        else:
+            remove_build_file(CRITICAL_CSS_BUILD_FILE)
+
+    # Static pages get the bundle but not the embedded data, which only
+    # the index page loads
+    page_slots = slots
+    with phase('Bundle'):
+        if bundle:
+            stylesheet = bundle_css(stylesheet)
+            script = f'<script src="{bundle_js()}"></script>'
+            slots['scripts'] = prerendered_data(data) + script
+            page_slots = dict(slots, scripts=script)
+        else:
+            for path in (BUNDLE_JS_FILE, BUNDLE_CSS_FILE):
+                remove_build_file(path + '.map')
+                remove_build_file(path)
+    if critical or bundle:
+        slots['stylesheet'] = stylesheet_tags(stylesheet, inline_css)
+
+    # After the critical CSS and bundle stages, which write stylesheets
+    # and scripts
+    with phase('Fingerprint assets'):
+        assets = build_assets(fingerprint)
+
+    # Save: sections stream from the fragment cache straight into the file.
+    # Time spent producing a section is booked to that section, not here.
+    with phase('Serialise'):
+        write_atomic(OUTPUT_FILE, rewrite_asset_refs(template.stream(slots, compact), assets))
+
+    print(f"Successfully compiled {TEMPLATE_FILE} to {OUTPUT_FILE}")
+
+    # Also runs without --static-pages, to remove pages left by earlier builds
+    with phase('Static pages'):
+        pages = build_static_pages(data, cache, page_template, page_slots, compact, assets) if page_template else {}
+        sync_static_pages(pages)
+
+
+# --- STATIC PAGES ---
+# With --static-pages every paginated section is also written as real
+# documents (projects/, projects/page/2/, ...) and every project, research
+# item and achievement gets a permalink page (projects/<id>/). Pages use the
+# page template: the index chrome with only the relevant section in <main>.
+# Cards come from the same renderers and fragment cache as index.html.
+
+STATIC_PAGES_FILE = os.path.join(CACHE_DIR, 'static-pages.json')
+PAGE_DESCRIPTION_LENGTH = 160
+
+
+def section_url(section, page=1):
+    return f'{section}/' if page == 1 else f'{section}/page/{page}/'
+
+
+def item_url(section, item):
+    return f"{section}/{item['id']}/"
+
+
+def page_of(index):
+    return index // ITEMS_PER_PAGE + 1
+
+
+def page_description(text):
+    text = ' '.join(html_text(render_markdown(text)).split())
+    if len(text) > PAGE_DESCRIPTION_LENGTH:
+        text = text[:PAGE_DESCRIPTION_LENGTH - 1].rsplit(' ', 1)[0] + '…'
+    return text
+
+
+def pagination_links(section, current, total):
+    if total <= 1:
+        return ''
+    links = []
+    if current > 1:
+        links.append(f'<a href="{section_url(section, current - 1)}" rel="prev">← Previous</a>')
+    for page in range(1, total + 1):
+        active = ' class="active" aria-current="page"' if page == current else ''
+        links.append(f'<a href="{section_url(section, page)}"{active}>{page}</a>')
+    if current < total:
+        links.append(f'<a href="{section_url(section, current + 1)}" rel="next">Next →</a>')
+    return f'<div class="pagination">{"".join(links)}</div>'
+
+
+# Show a card's detail document without needing a click
+def expand_details(html, detail):
+    if '<div class="detail-content" style="display:none">' in html:
+        html = html.replace('<div class="detail-content" style="display:none">', '<div class="detail-content">', 1)
+    elif detail and os.path.exists(os.path.join(BASE_DIR, detail)):
+        with open(os.path.join(BASE_DIR, detail), 'r', encoding='utf-8') as f:
+            content = render_markdown_fragment(f.read())
+        html = html[:-len('</div>')] + f'<div class="detail-content">{content}</div></div>'
+    return html.replace('>Show Details</button>', '>Hide Details</button>', 1)
+
+
+def render_page(page_template, slots, compact, assets, url, title, description, main):
+    values = dict(slots)
+    values.update({
+        'page-root': f'<base href="{"../" * url.count("/")}">',
+        'page-title': escape(title),
+        'page-description': escape_attr(description),
+        'page-url': escape_attr(base_url + url),
+        'page-main': main
+    })
+    return ''.join(rewrite_asset_refs(page_template.stream(values, compact), assets)).encode('utf-8')
+
+
+def build_static_pages(data, cache, page_template, slots, compact=False, assets=None):
+    name = data.get('about', {}).get('name', '')
+    pages = {}
+    for section, heading in STATIC_PAGE_SECTIONS.items():
+        items = data.get(section) or []
+        if not items:
+            continue
+        render = CARD_RENDERERS[section][0]
+        keys, _ = section_keys(cache, section, items)
+        cards = [cache.get(key, lambda: render_timed(section, render, item)) for key, item in zip(keys, items)]
+        total = page_of(len(items) - 1)
+
+        for page in range(1, total + 1):
+            start = (page - 1) * ITEMS_PER_PAGE
+            url = section_url(section, page)
+            main = (
+                f'<section id="{section}" class="section"><h2>{heading}</h2>'
+                f'<div id="{section}-content">{"".join(cards[start:start + ITEMS_PER_PAGE])}</div>'
+                f'{pagination_links(section, page, total)}</section>'
+            )
+            title = f'{heading} | {name}' if page == 1 else f'{heading} (page {page}) | {name}'
+            pages[url] = render_page(page_template, slots, compact, assets, url, title, f'{heading} by {name}', main)
+
+        if section not in PERMALINK_SECTIONS:
+            continue
+        for i, (item, card) in enumerate(zip(items, cards)):
+            url = item_url(section, item)
+            back = section_url(section, page_of(i))
+            main = (
+                f'<section id="{section}" class="section">'
+                f'<h2><a href="{back}">{heading}</a></h2>'
+                f'<div id="{section}-content">{expand_details(card, item.get("detail"))}</div></section>'
+            )
+            title = f"{item['title']} | {name}"
+            pages[url] = render_page(page_template, slots, compact, assets, url, title, page_description(item.get('summary', '')), main)
+    return pages
+
+
+# Write pages that changed and delete the ones the last build wrote but
+# this one did not (along with their compressed copies)
+def sync_static_pages(pages):
+    try:
+        with open(STATIC_PAGES_FILE, 'r', encoding='utf-8') as f:
+            previous = json.load(f)
+    except (OSError, ValueError):
+        previous = []
+
+    written = 0
+    for url, content in pages.items():
+        if write_if_changed(os.path.join(BASE_DIR, url, 'index.html'), content):
+            written += 1
+
+    for url in previous:
+        if url in pages:
+            continue
+        path = os.path.join(BASE_DIR, url, 'index.html')
+        for stale in [path] + compressed_copies(path):
+            if os.path.exists(stale):
+                os.remove(stale)
+        # Remove the now empty page directories, up to the section directory
+        directory = os.path.dirname(path)
+        while directory != BASE_DIR and os.path.isdir(directory) and not os.listdir(directory):
+            os.rmdir(directory)
+            directory = os.path.dirname(directory)
+
+    if pages or previous:
+        os.makedirs(CACHE_DIR, exist_ok=True)
+        with open(STATIC_PAGES_FILE, 'w', encoding='utf-8') as f:
+            json.dump(sorted(pages), f)
+        print(f"Static pages: {len(pages)} total, {written} updated, {len(set(previous) - set(pages))} removed")
+
+
+# --- SITEMAP GENERATION ---
+# URLs are streamed into sitemap.xml, then sitemap-2.xml, sitemap-3.xml, ...
+# whenever a file would go over the protocol limits, and sitemap-index.xml
+# lists every shard. Each URL's <lastmod> is the date its content hash (the
+# JSON entry plus its detail document) last changed. That history is written
+# to sitemap-lastmod.json next to the sitemap and committed with it, so a
+# fresh checkout (CI without .build-cache/) keeps the old dates; new or
+# changed URLs get the source date, i.e. the inputs' last commit.
+
+SITEMAP_INDEX_FILE = os.path.join(BASE_DIR, 'sitemap-index.xml')
+SITEMAP_LASTMOD_FILE = os.path.join(BASE_DIR, 'sitemap-lastmod.json')
+SITEMAP_MAX_URLS = 50000
+SITEMAP_MAX_BYTES = 50 * 1024 * 1024
+SITEMAP_HEADER = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9" xmlns:image="http://www.google.com/schemas/sitemap-image/1.1">\n'
+).encode('utf-8')
+SITEMAP_FOOTER = b'</urlset>'
+
+
+def sitemap_shard_path(n):
+    return SITEMAP_FILE if n == 1 else os.path.join(BASE_DIR, f'sitemap-{n}.xml')
+
+
+def content_hash(item, files):
+    detail = item.get('detail') if isinstance(item, dict) else None
+    return sha256_json([item, files.get(detail, {}).get('hash') if detail else None])
+
+
+# (loc, priority, changefreq, content hash) for every URL, in sitemap order
+def sitemap_urls(data, files, static_pages):
+    yield base_url, "1.0", "weekly", sha256_json(data)
+    yield base_url + "#about", "0.9", "monthly", sha256_json(data.get('about'))
+    yield base_url + "#techstack", "0.8", "monthly", sha256_json(data.get('techstack'))
+    yield base_url + "#projects", "0.9", "weekly", sha256_json([content_hash(p, files) for p in data.get('projects', [])])
+
+    if static_pages:
+        # Real documents written by --static-pages
+        for section in STATIC_PAGE_SECTIONS:
+            items = data.get(section) or []
+            total = page_of(len(items) - 1) if items else 0
+            for page in range(1, total + 1):
+                page_items = items[(page - 1) * ITEMS_PER_PAGE:page * ITEMS_PER_PAGE]
+                yield (base_url + section_url(section, page), "0.8", "weekly",
+                       sha256_json([content_hash(item, files) for item in page_items]))
+            if section in PERMALINK_SECTIONS:
+                for item in items:
+                    priority = "0.8" if section == 'projects' else "0.7"
+                    yield base_url + item_url(section, item), priority, "monthly", content_hash(item, files)
+        return
+
+    for project in data.get('projects', []):
+        yield f"{base_url}#projects/{project['id']}", "0.8", "monthly", content_hash(project, files)
+    for item in data.get('research', []):
+        yield f"{base_url}#research/{item['id']}", "0.7", "monthly", content_hash(item, files)
+
+
+def sitemap_entries(data, files, static_pages, history, today):
+    seen = set()
+    for loc, priority, changefreq, digest in sitemap_urls(data, files, static_pages):
+        previous = history.get(loc)
+        lastmod = previous[1] if previous and previous[0] == digest else today
+        history[loc] = [digest, lastmod]
+        seen.add(loc)
+
+        entry = f'  <url>\n    <loc>{escape(loc)}</loc>\n    <lastmod>{lastmod}</lastmod>\n'
+        entry += f'    <changefreq>{changefreq}</changefreq>\n    <priority>{priority}</priority>\n'
+        # Add image for root URL
+        if loc == base_url and 'about' in data and 'photo' in data['about']:
+            about = data['about']
+            entry += '    <image:image>\n'
+            entry += f"      <image:loc>{escape(base_url + about['photo'])}</image:loc>\n"
+            entry += f"      <image:title>{escape(about.get('name', ''))} - {escape(about.get('tagline', ''))}</image:title>\n"
+            entry += '    </image:image>\n'
+        entry += '  </url>\n'
+        yield entry.encode('utf-8'), lastmod
+
+    # Forget URLs that are gone, so a returning one starts fresh
+    for loc in set(history) - seen:
+        del history[loc]
+
+
+# Stream entries into as many shards as the limits require. Returns the
+# newest lastmod of each shard, in order.
+def write_sitemap_shards(entries):
+    entries = iter(entries)
+    pending = [next(entries, None)]
+    shards = []
+    while True:
+        newest = ['']
+
+        def shard_chunks():
+            yield SITEMAP_HEADER
+            size = len(SITEMAP_HEADER) + len(SITEMAP_FOOTER)
+            urls = 0
+            while pending[0] is not None:
+                entry, lastmod = pending[0]
+                if urls and (urls == SITEMAP_MAX_URLS or size + len(entry) > SITEMAP_MAX_BYTES):
+                    break
+                yield entry
+                size += len(entry)
+                urls += 1
+                newest[0] = max(newest[0], lastmod)
+                pending[0] = next(entries, None)
+            yield SITEMAP_FOOTER
+
+        write_atomic(sitemap_shard_path(len(shards) + 1), shard_chunks(), binary=True)
+        shards.append(newest[0])
+        if pending[0] is None:
+            return shards
+
+
+def load_lastmod_history():
+    try:
+        with open(SITEMAP_LASTMOD_FILE, 'r', encoding='utf-8') as f:
+            history = json.load(f)
+        if isinstance(history, dict):
+            return history
+    except (OSError, ValueError):
+        pass
+    return {}
+
+
+def build_sitemap(data, files, updated, static_pages=False):
+    print("Updating sitemap.xml...")
+    today = updated.strftime("%Y-%m-%d")
+    history = load_lastmod_history()
+    shards = write_sitemap_shards(sitemap_entries(data, files, static_pages, history, today))
+
+    # Shards left over from a bigger site
+    for path in glob.glob(os.path.join(BASE_DIR, 'sitemap-*.xml')):
+        match = re.fullmatch(r'sitemap-(\d+)\.xml', os.path.basename(path))
+        if match and int(match.group(1)) > len(shards):
+            for stale in [path] + compressed_copies(path):
+                if os.path.exists(stale):
+                    os.remove(stale)
+
+    def index_chunks():
+        yield '<?xml version="1.0" encoding="UTF-8"?>\n'
+        yield '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+        for n, lastmod in enumerate(shards, 1):
+            loc = base_url + os.path.basename(sitemap_shard_path(n))
+            yield f'  <sitemap>\n    <loc>{loc}</loc>\n    <lastmod>{lastmod}</lastmod>\n  </sitemap>\n'
+        yield '</sitemapindex>'
+
+    write_atomic(SITEMAP_INDEX_FILE, index_chunks())
+    write_if_changed(SITEMAP_LASTMOD_FILE, (json.dumps(history, indent=2, sort_keys=True) + '\n').encode('utf-8'))
+    print(f"Successfully updated sitemap.xml ({len(shards)} shard{'s' if len(shards) != 1 else ''} in sitemap-index.xml)")
+
+
+# --- LLMS.TXT GENERATION ---
+# llms.txt lists every card in one line. llms-full.txt is the same list
+# followed by every detail document under details/, and the budgeted
+# variants (llms-8k.txt, llms-32k.txt) hold as much of llms-full.txt as
+# fits their token budget. Token counts are estimated from byte sizes, the
+# detail documents' taken from the input manifest, so choosing what goes in
+# reads nothing. Each file is streamed entry by entry, the detail documents
+# line by line from their markdown sources.
+
+LLMS_FULL_FILE = os.path.join(BASE_DIR, 'llms-full.txt')
+LLMS_BUDGETS = {'llms-8k.txt': 8000, 'llms-32k.txt': 32000}
+LLMS_DETAIL_SECTIONS = ['projects', 'achievements']
+BYTES_PER_TOKEN = 4
+HTML_TAG_PATTERN = re.compile(r'<[^>]+>')
+MARKDOWN_HEADING_PATTERN = re.compile(r'(#{1,6})\s')
+
+
+def estimate_tokens(size):
+    return -(-size // BYTES_PER_TOKEN)
+
+
+def plain_text(html):
+    return unescape(HTML_TAG_PATTERN.sub('', html))
+
+
+# An entry is literal text or a detail document to stream: (text, path, tokens)
+def text_entry(text):
+    return (text, None, estimate_tokens(len(text.encode('utf-8'))))
+
+
+def item_link(section, item, link=''):
+    return link or f"{base_url}#{section}/{item.get('id', '')}"
+
+
+# The card list as (header, entries, footer) sections, in the order they
+# are written and kept under a budget
+def llms_sections(data):
+    if 'about' in data:
+        name = data['about'].get('name', 'Portfolio')
+        tagline = data['about'].get('tagline', '')
+        bio = data['about'].get('bio', '')
+
+        intro = f"# {name}\n\n"
+        if tagline:
+            intro += f"> {tagline}\n\n"
+        if bio:
+            intro += f"{bio}\n\n"
+        yield '', [text_entry(intro)], ''
+
+    # Projects
+    if 'projects' in data:
+        entries = []
+        for project in data['projects']:
+            title = project.get('title', 'Project')
+            summary = project.get('summary', '')
+            links = project.get('links', {})
+            link = item_link('projects', project, links.get('github') or links.get('demo'))
+            entries.append(text_entry(f"- [{title}]({link}): {summary}\n"))
+        yield "## Projects\n\n", entries, "\n"
+
+    # Research
+    if 'research' in data:
+        entries = []
+        for item in data['research']:
+            title = item.get('title', 'Paper')
+            summary = item.get('summary', '')
+            link = item_link('research', item, item.get('link') or (f"https://doi.org/{item['doi']}" if 'doi' in item else ''))
+            entries.append(text_entry(f"- [{title}]({link}): {summary}\n"))
+        yield "## Research\n\n", entries, "\n"
+
+    # Achievements
+    if 'achievements' in data:
+        entries = []
+        for item in data['achievements']:
+            title = item.get('title', 'Achievement')
+            summary = plain_text(item.get('summary', ''))
+            link = item_link('achievements', item, item.get('link'))
+            entries.append(text_entry(f"- [{title}]({link}) ({item.get('date', '')}): {summary}\n"))
+        yield "## Achievements\n\n", entries, "\n"
+
+    # Experience
+    if 'experience' in data:
+        entries = []
+        for item in data['experience']:
+            role = item.get('role', '')
+            company = item.get('company', '')
+            desc = item.get('description', '')
+            entries.append(text_entry(f"- **{role}** at {company}: {desc}\n"))
+        yield "## Experience\n\n", entries, "\n"
+
+    # Education
+    if 'education' in data:
+        entries = []
+        for item in data['education']:
+            entries.append(text_entry(
+                f"- **{item.get('degree', '')}**, {item.get('institution', '')} ({item.get('year', '')}): "
+                f"Grade {item.get('grade', '')}\n"
+            ))
+        yield "## Education\n\n", entries, "\n"
+
+    # Certifications
+    if 'certifications' in data:
+        entries = []
+        for item in data['certifications']:
+            title = item.get('title', 'Certification')
+            link = item_link('certifications', item, item.get('link'))
+            entries.append(text_entry(f"- [{title}]({link}): {item.get('issuer', '')}, {item.get('date', '')}\n"))
+        yield "## Certifications\n\n", entries, "\n"
+
+    # Skills
+    if 'techstack' in data:
+        entries = []
+        for category in data['techstack']:
+            cat_name = category.get('category', '')
+            skills = ", ".join(category.get('skills', []))
+            entries.append(text_entry(f"- **{cat_name}**: {skills}\n"))
+        yield "## Skills\n\n", entries, "\n"
+
+
+def detail_sections(data, files):
+    entries = []
+    for section in LLMS_DETAIL_SECTIONS:
+        for item in data.get(section, []):
+            detail = item.get('detail')
+            if detail and os.path.exists(os.path.join(BASE_DIR, detail)):
+                size = files[detail]['size'] if detail in files else os.path.getsize(os.path.join(BASE_DIR, detail))
+                entries.append((None, detail, estimate_tokens(size + 2)))
+    if entries:
+        yield "## Details\n\n", entries, ""
+
+
+# A detail document with its headings moved down so its first one is a
+# level-3 heading, under ## Details
+def detail_chunks(detail):
+    fenced = False
+    shift = None
+    line = ''
+    with open(os.path.join(BASE_DIR, detail), 'r', encoding='utf-8') as f:
+        for line in f:
+            if line.lstrip().startswith(('```', '~~~')):
+                fenced = not fenced
+            match = None if fenced else MARKDOWN_HEADING_PATTERN.match(line)
+            if match:
+                level = len(match.group(1))
+                if shift is None:
+                    shift = max(3 - level, 0)
+                line = '#' * min(level + shift, 6) + line[level:]
+            yield line
+    yield '\n' if line.endswith('\n') else '\n\n'
+
+
+# Keep each entry that still fits the budget, in order
+def within_budget(sections, budget):
+    used = 0
+    for header, entries, footer in sections:
+        cost = estimate_tokens(len((header + footer).encode('utf-8')))
+        kept = []
+        for entry in entries:
+            if used + cost + entry[2] <= budget:
+                cost += entry[2]
+                kept.append(entry)
+        if kept:
+            used += cost
+            yield header, kept, footer
+
+
+def llms_chunks(sections):
+    for header, entries, footer in sections:
+        yield header
+        for text, detail, _ in entries:
+            if detail:
+                yield from detail_chunks(detail)
+            else:
+                yield text
+        yield footer
+
+
+def build_llms(data, files):
+    print("Generating llms.txt...")
+    summary = list(llms_sections(data))
+    full = summary + list(detail_sections(data, files))
+    write_atomic(LLMS_FILE, llms_chunks(summary))
+    write_atomic(LLMS_FULL_FILE, llms_chunks(full))
+    for name, budget in LLMS_BUDGETS.items():
+        write_atomic(os.path.join(BASE_DIR, name), llms_chunks(within_budget(full, budget)))
+
+    tokens = sum(entry[2] for _, entries, _ in full for entry in entries)
+    print(f"Successfully generated llms.txt and llms-full.txt (~{tokens} tokens), "
+          f"{', '.join(LLMS_BUDGETS)}")
+
+
+# --- SEARCH INDEX ---
+# search-index.json is an inverted index over the searchable cards, loaded
+# by js/main.js the first time the search box is used:
+#   docs      [section, id, title] per card
+#   terms     every indexed term, sorted
+#   postings  per term a flat [doc, score, doc, score, ...] list, sorted by
+#             doc with each doc stored as the delta from the previous one
+#   prefixes  first two characters of a term -> [start, end) into terms,
+#             so a prefix query is a table lookup plus a binary search
+# The tokenizer must stay in sync with tokenize() in js/main.js.
+
+SEARCH_INDEX_VERSION = 1
+SEARCH_TOKEN_PATTERN = re.compile(r'[^\W_]+')
+SEARCH_STOPWORDS = frozenset(
+    'an and are as at be by for from has in into is it of on or that the this to was were with'.split()
+)
+# Score added per occurrence of a term in each field
+SEARCH_FIELD_WEIGHTS = {'title': 8, 'tech': 4, 'meta': 2, 'summary': 2, 'detail': 1}
+
+
+# Term -> occurrences, skipping one-character terms and stopwords
+def search_tokens(text):
+    tokens = Counter(SEARCH_TOKEN_PATTERN.findall(text.lower()))
+    return {t: n for t, n in tokens.items() if len(t) > 1 and t not in SEARCH_STOPWORDS}
+
+
+def html_text(html):
+    return unescape(re.sub(r'<[^>]+>', ' ', html))
+
+
+def search_fields(item):
+    fields = {
+        'title': item.get('title', ''),
+        'tech': ' '.join(item.get('tech', [])),
+        'meta': ' '.join(str(item.get(key, '')) for key in ('publisher', 'issuer', 'year', 'date')),
+        'summary': html_text(render_markdown(item.get('summary', ''))),
+        'detail': ''
+    }
+    detail = item.get('detail')
+    detail_path = os.path.join(BASE_DIR, detail) if detail else None
+    if detail_path and os.path.exists(detail_path):
+        with open(detail_path, 'r', encoding='utf-8') as f:
+            fields['detail'] = html_text(render_markdown(f.read()))
+    return fields
+
+
+def search_terms(item):
+    scores = {}
+    for field, text in search_fields(item).items():
+        weight = SEARCH_FIELD_WEIGHTS[field]
+        for term, n in search_tokens(text).items():
+            scores[term] = scores.get(term, 0) + weight * n
+    return json.dumps(scores, ensure_ascii=False, separators=(',', ':'))
+
+
+# Per-card term scores live in the fragment cache, so an edit only
+# re-tokenizes the cards (and detail documents) that changed
+def build_search_index(data, cache):
+    print("Building search index...")
+    docs = []
+    postings = {}
+    for section in SEARCH_DATA:
+        for item in data.get(section) or []:
+            doc = len(docs)
+            docs.append([section, item.get('id', ''), item.get('title', '')])
+            key = cache.key('search', item, item.get('detail'))
+            for term, score in json.loads(cache.get(key, lambda: search_terms(item))).items():
+                postings.setdefault(term, []).append((doc, score))
+
+    terms = sorted(postings)
+    encoded = []
+    prefixes = {}
+    for i, term in enumerate(terms):
+        flat = []
+        previous = 0
+        for doc, score in postings[term]:
+            flat += [doc - previous, score]
+            previous = doc
+        encoded.append(flat)
+        start_end = prefixes.setdefault(term[:2], [i, i])
+        start_end[1] = i + 1
+
+    index = {
+        'version': SEARCH_INDEX_VERSION,
+        'docs': docs,
+        'terms': terms,
+        'postings': encoded,
+        'prefixes': prefixes
+    }
+    content = json.dumps(index, ensure_ascii=False, separators=(',', ':'))
+    write_atomic(SEARCH_INDEX_FILE, [content])
+    count('search.docs', len(docs))
+    count('search.terms', len(terms))
+    print(f"Successfully built search-index.json ({len(docs)} cards, {len(terms)} terms, {len(content.encode('utf-8'))} bytes)")
+
+
+# --- WATCH MODE ---
+# --watch keeps the template, markdown cache and parsed data in memory,
+# rebuilds whenever an input changes and serves BASE_DIR with a tiny
+# Server-Sent Events endpoint that tells open pages to reload.
+
+WATCH_DEBOUNCE = 0.02
+POLL_INTERVAL = 0.25
+LIVE_RELOAD_PATH = '/__livereload'
+LIVE_RELOAD_SCRIPT = b"<script>new EventSource('/__livereload').onmessage = () => location.reload();</script>"
+
+
+class LiveReload:
+    # Build generation shared by the watch loop and the event streams
+    def __init__(self):
+        self.generation = 0
+        self.condition = threading.Condition()
+
+    def notify(self):
+        with self.condition:
+            self.generation += 1
+            self.condition.notify_all()
+
+    def wait(self, generation, timeout):
+        with self.condition:
+            self.condition.wait_for(lambda: self.generation != generation, timeout)
+            return self.generation
+
+
+def make_dev_handler(live_reload):
+    from http.server import SimpleHTTPRequestHandler
+
+    class DevServerHandler(SimpleHTTPRequestHandler):
+        def __init__(self, *args, **kwargs):
+            super().__init__(*args, directory=BASE_DIR, **kwargs)
+
+        def log_message(self, format, *args):
+            pass
+
+        def do_GET(self):
+            path = self.path.split('?', 1)[0]
+            if path == LIVE_RELOAD_PATH:
+                return self.send_events()
+            fs_path = self.translate_path(path)
+            if path.endswith('/'):
+                fs_path = os.path.join(fs_path, 'index.html')
+            if fs_path.endswith('.html') and os.path.isfile(fs_path):
+                return self.send_html(fs_path)
+            return super().do_GET()
+
+        # Serve pages with the live reload client injected before </body>
+        def send_html(self, fs_path):
+            with open(fs_path, 'rb') as f:
+                body = f.read()
+            end = body.rfind(b'</body>')
+            body = body[:end] + LIVE_RELOAD_SCRIPT + body[end:] if end >= 0 else body + LIVE_RELOAD_SCRIPT
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/html; charset=utf-8')
+            self.send_header('Content-Length', str(len(body)))
+            self.send_header('Cache-Control', 'no-store')
+            self.end_headers()
+            self.wfile.write(body)
+
+        def send_events(self):
+            self.send_response(200)
+            self.send_header('Content-Type', 'text/event-stream')
+            self.send_header('Cache-Control', 'no-store')
+            self.end_headers()
+            generation = live_reload.generation
+            try:
+                while True:
+                    current = live_reload.wait(generation, 15)
+                    if current != generation:
+                        generation = current
+                        self.wfile.write(b'data: reload\n\n')
+                    else:
+                        self.wfile.write(b': keepalive\n\n')
+                    self.wfile.flush()
+            except (BrokenPipeError, ConnectionResetError):
+                pass
+
+    return DevServerHandler
+
+
+def watch_directories():
+    directories = [BASE_DIR, DATA_DIR, IMAGES_DIR, CSS_DIR, JS_DIR]
+    for root, dirnames, _ in os.walk(DETAILS_DIR):
+        dirnames[:] = [d for d in dirnames if os.path.join(root, d) != DETAIL_BUILD_DIR]
+        directories.append(root)
+    return [d for d in directories if os.path.isdir(d)]
+
+
+class InotifyWatcher:
+    # Minimal inotify binding through ctypes; Linux only
+    IN_MODIFY = 0x002
+    IN_CLOSE_WRITE = 0x008
+    IN_MOVED_FROM = 0x040
+    IN_MOVED_TO = 0x080
+    IN_CREATE = 0x100
+    IN_DELETE = 0x200
+    MASK = IN_MODIFY | IN_CLOSE_WRITE | IN_MOVED_FROM | IN_MOVED_TO | IN_CREATE | IN_DELETE
+
+    def __init__(self):
+        import ctypes
+        import ctypes.util
+        self.libc = ctypes.CDLL(ctypes.util.find_library('c') or 'libc.so.6', use_errno=True)
+        self.fd = self.libc.inotify_init1(os.O_CLOEXEC | os.O_NONBLOCK)
+        if self.fd < 0:
+            raise OSError(ctypes.get_errno(), 'inotify_init1 failed')
+        self.add_watches()
+
+    # Re-adding a watched directory is a no-op, so new detail folders are
+    # picked up by calling this after every batch of events
+    def add_watches(self):
+        for directory in watch_directories():
+            self.libc.inotify_add_watch(self.fd, os.fsencode(directory), self.MASK)
+
+    def wait(self, timeout):
+        ready, _, _ = select.select([self.fd], [], [], timeout)
+        if not ready:
+            return False
+        try:
+            while os.read(self.fd, 65536):
+                pass
+        except BlockingIOError:
+            pass
+        self.add_watches()
+        return True
+
+
+class PollingWatcher:
+    # Fallback: wake up periodically and let the caller compare input hashes
+    def wait(self, timeout):
+        time.sleep(min(timeout, POLL_INTERVAL))
+        return True
+
+
+def input_hashes(files):
+    return {name: entry['hash'] for name, entry in files.items()}
+
+
+def watch(args):
+    state = {}
+    build(args, state)
+    args.force = False
+
+    from http.server import ThreadingHTTPServer
+
+    live_reload = LiveReload()
+    server = ThreadingHTTPServer((args.host, args.port), make_dev_handler(live_reload))
+    server.daemon_threads = True
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+
+    try:
+        watcher = InotifyWatcher()
+        method = 'inotify'
+    except (OSError, AttributeError):
+        watcher = PollingWatcher()
+        method = 'polling'
+    print(f"Serving {BASE_DIR} at http://{args.host}:{args.port}/")
+    print(f"Watching for changes ({method}), press Ctrl+C to stop")
+
+    try:
+        while True:
+            if not watcher.wait(1.0):
+                continue
+            # Let editors finish their write/rename dance
+            time.sleep(WATCH_DEBOUNCE)
+            files = scan_inputs(state['manifest'])
+            changed = sorted(name for name, file_hash in input_hashes(files).items()
+                             if input_hashes(state['files']).get(name) != file_hash)
+            changed += sorted(set(state['files']) - set(files))
+            if not changed:
+                continue
+            if 'compile.py' in changed:
+                print("compile.py changed: restart --watch to run the new code")
+            # Remember this scan even if the build fails, so a broken input is
+            # reported once and retried on its next change, not every tick
+            state['files'] = files
+
+            start = time.perf_counter()
+            try:
+                build(args, state)
+            except DataError as e:
+                print(f"Invalid data, not rebuilt:\n{e}")
+                continue
+            except BudgetError as e:
+                print(f"Budget exceeded:\n{e}")
+            except Exception:
+                traceback.print_exc()
+                continue
+            live_reload.notify()
+            print(f"Rebuilt after {', '.join(changed)} changed in {(time.perf_counter() - start) * 1000:.0f} ms")
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+# One build. `state` carries the manifest, parsed data and compiled
+# template between builds of the same process (watch mode).
+def build(args, state):
+    reset_stats()
+    jobs = args.jobs or os.cpu_count() or 1
+
+    if args.profile:
+        profiling['events'] = []
+    if args.cprofile_dir:
+        os.makedirs(args.cprofile_dir, exist_ok=True)
+        profiling['cprofile_dir'] = args.cprofile_dir
+
+    print(f"Compiling {TEMPLATE_FILE}...")
+
+    with phase('Scan inputs'):
+        manifest = state.get('manifest') or load_manifest()
+        if args.force:
+            manifest['outputs'] = {}
+        files = scan_inputs(manifest)
+        deps = output_deps(files)
+        options = {
+            OUTPUT_FILE: [args.output_style, f'lazy_details={args.lazy_details}', f'responsive_images={args.responsive_images}',
+                          f'static_pages={args.static_pages}', f'fingerprint={args.fingerprint}',
+                          f'critical_css={args.critical_css}', f'bundle={args.bundle}'],
+            SITEMAP_FILE: [f'static_pages={args.static_pages}']
+        }
+        # Only these two embed the build date
+        for path in (OUTPUT_FILE, SITEMAP_FILE):
+            options[path].append(f"source_date_epoch={os.environ.get('SOURCE_DATE_EPOCH', '')}")
+        if not args.archive or rel_path(ARCHIVE_FILE) not in files:
+            del deps[ARCHIVE_MANIFEST_FILE]
+        signatures = {path: output_signature(files, deps[path], options.get(path, [])) for path in deps}
+        stale = [path for path in deps if not output_is_fresh(manifest, path, signatures[path])]
+
+    if stale:
+        updated = source_date(manifest, files)
+
+        # Load Data
+        with phase('Load data'):
+            data = load_data(files, state.setdefault('loaded', {}))
+        print_stats(data)
+
+        compiler_hash = files[rel_path(os.path.abspath(__file__))]['hash']
+        cache = FragmentCache(compiler_hash, files, render_options)
+        if OUTPUT_FILE in stale:
+            with phase('Template'):
+                template_key = (compiler_hash, files[rel_path(TEMPLATE_FILE)]['hash'])
+                if state.get('template_key') != template_key:
+                    state['template'] = Template.load(TEMPLATE_FILE, *template_key)
+                    state['template_key'] = template_key
+                template = state['template']
+                page_template = None
+                if args.static_pages:
+                    if state.get('page_template_key') != template_key:
+                        state['page_template'] = Template.load(TEMPLATE_FILE, *template_key, page=True)
+                        state['page_template_key'] = template_key
+                    page_template = state['page_template']
+            with phase('Images'):
+                if args.responsive_images:
+                    images = build_images(data, files)
+                else:
+                    images = {}
+                    remove_image_variants()
+            build_index(data, cache, template, jobs, args.output_style == 'compact', images, page_template,
+                        args.fingerprint, args.critical_css, files, args.bundle, updated)
+        if SITEMAP_FILE in stale:
+            with phase('Sitemap'):
+                build_sitemap(data, files, updated, args.static_pages)
+        if LLMS_FILE in stale:
+            with phase('llms.txt'):
+                build_llms(data, files)
+        if SEARCH_INDEX_FILE in stale:
+            with phase('Search index'):
+                build_search_index(data, cache)
+        if ARCHIVE_MANIFEST_FILE in stale:
+            with phase('Archive'):
+                build_archive()
+        # Card fragments and search terms share the cache, so only prune
+        # when both were built and every live key has been seen
+        with phase('Cache upkeep'):
+            if OUTPUT_FILE in stale and SEARCH_INDEX_FILE in stale:
+                cache.prune()
+            markdown_cache.trim()
+        print(f"Fragments: {cache.hits} reused, {cache.misses} rendered")
+        markdown_cache.print_stats()
+    else:
+        print("No changes detected, outputs are up to date.")
+
+    # Extracted projects left by an earlier --archive build
+    if ARCHIVE_MANIFEST_FILE not in deps and os.path.exists(ARCHIVE_MANIFEST_FILE):
+        clean_archive([])
+        manifest['outputs'].pop(rel_path(ARCHIVE_MANIFEST_FILE), None)
+
+    with phase('Compress'):
+        if args.compress:
+            compress_outputs(manifest, jobs)
+        else:
+            # Copies from an earlier --compress build would be served in
+            # place of the updated files. Detail fragments keep theirs:
+            # write_detail_fragments() rewrites them with every fragment.
+            manifest.pop('compressed', None)
+            remove_compressed_copies(set(glob.glob(os.path.join(DETAIL_BUILD_DIR, '**', '*.html'), recursive=True)))
+
+    with phase('Save manifest'):
+        manifest['files'] = files
+        for path in stale:
+            record_output(manifest, path, signatures[path])
+        save_manifest(manifest)
+    state['manifest'] = manifest
+    state['files'] = files
+
+    failures = []
+    if args.budget:
+        with phase('Budgets'):
+            failures = enforce_budgets(args.budget, source_date(manifest, files))
+
+    count('markdown.convert', markdown_cache.misses)
+    count('markdown.cache_hit', markdown_cache.memory_hits + markdown_cache.disk_hits)
+    if stale:
+        count('fragment.render', cache.misses)
+        count('fragment.cache_hit', cache.hits)
+
+    if args.timings:
+        write_timings(args.timings)
+    if args.profile:
+        write_trace(args.profile)
+        print_profile(args.profile_top)
+        print(f"Trace written to {args.profile} (open in https://ui.perfetto.dev or chrome://tracing)")
+    if failures:
+        raise BudgetError(failures)
+    return stale
+
+
+# --- BATCH MODE ---
+# --batch SITES.json builds many sites from one process tree, -j N sites at
+# a time (-j 0: one per CPU):
+#
+#   {"template": "index-dynamic.html",
+#    "sites": [{"root": "sites/alice", "base_url": "https://alice.example/"}, ...]}
+#
+# Each root holds a site's inputs (data/, details/, images/, css/, js/) and
+# receives its outputs. Paths are relative to the config file. A top-level
+# "template" is compiled once and shared by every site that does not name
+# its own; without one each site uses its own index-dynamic.html. bs4 and
+# markdown are imported once before the workers start, and all sites share
+# this checkout's markdown cache.
+
+batch_state = {}
+
+
+# Every path constant is derived from BASE_DIR: move them all to another
+# root, except the markdown cache, which the sites share. Paths and
+# base_url start from the checkout's values for every site, so nothing a
+# previous site set in this worker carries over.
+def configure_site(root, url=None, template=None):
+    global base_url
+    if not site_defaults:
+        site_defaults.update({name: value for name, value in globals().items()
+                              if name.endswith(('_DIR', '_FILE')) and isinstance(value, str)})
+        site_defaults['base_url'] = base_url
+    checkout = site_defaults['BASE_DIR']
+    root = os.path.abspath(root)
+    for name, value in site_defaults.items():
+        if name != 'MARKDOWN_CACHE_DIR' and (value == checkout or value.startswith(checkout + os.sep)):
+            globals()[name] = root + value[len(checkout):]
+    if template:
+        globals()['TEMPLATE_FILE'] = os.path.abspath(template)
+    base_url = url or site_defaults['base_url']
+
+
+site_defaults = {}
+
+
+def load_batch_config(path):
+    with open(path, 'r', encoding='utf-8') as f:
+        config = json.load(f)
+    config_dir = os.path.dirname(os.path.abspath(path))
+    resolve = lambda p: os.path.join(config_dir, p) if p else None
+    sites = []
+    for i, site in enumerate(config.get('sites', [])):
+        if not isinstance(site, dict) or not isinstance(site.get('root'), str):
+            raise DataError([f"{path}: $.sites[{i}]: missing required field 'root'"])
+        sites.append({'root': resolve(site['root']), 'base_url': site.get('base_url'),
+                      'template': resolve(site.get('template'))})
+    return resolve(config.get('template')), sites
+
+
+def init_batch_worker(state, options):
+    batch_state.update(state)
+    render_options.update(options)
+
+
+# Pool worker: build one site with its output captured. Returns
+# (root, stale outputs or None, seconds, log).
+def build_site(task):
+    import io
+    from contextlib import redirect_stdout
+    site, args = task
+    configure_site(site['root'], site['base_url'], site['template'] or batch_state.get('template_file'))
+    state = {}
+    if not site['template'] and 'template' in batch_state:
+        state['template'] = batch_state['template']
+        state['template_key'] = batch_state['template_key']
+    log = io.StringIO()
+    start = time.perf_counter()
+    try:
+        with redirect_stdout(log):
+            stale = build(args, state)
+    except Exception as e:
+        log.write(f"{e}\n" if isinstance(e, (DataError, BudgetError)) else traceback.format_exc())
+        stale = None
+    return site['root'], stale, time.perf_counter() - start, log.getvalue()
+
+
+def batch(args):
+    from concurrent.futures import ProcessPoolExecutor
+    # Imported here so the workers inherit it instead of each importing it
+    import markdown  # noqa: F401
+    template_file, sites = load_batch_config(args.batch)
+    state = {}
+    if template_file:
+        with open(os.path.abspath(__file__), 'rb') as f:
+            compiler_hash = sha256_bytes(f.read())
+        with open(template_file, 'rb') as f:
+            template_hash = sha256_bytes(f.read())
+        state = {
+            'template_file': template_file,
+            'template': Template.load(template_file, compiler_hash, template_hash),
+            'template_key': (compiler_hash, template_hash)
+        }
+    jobs = args.jobs or os.cpu_count() or 1
+    # Each site renders its cards in its own worker, one at a time
+    site_args = argparse.Namespace(**{**vars(args), 'jobs': 1, 'timings': None, 'profile': None, 'cprofile_dir': None})
+
+    print(f"Building {len(sites)} sites with {jobs} workers...")
+    start = time.perf_counter()
+    failed = 0
+    with ProcessPoolExecutor(max_workers=jobs, initializer=init_batch_worker, initargs=(state, render_options)) as pool:
+        for root, stale, seconds, log in pool.map(build_site, [(site, site_args) for site in sites]):
+            if stale is None:
+                failed += 1
+                print(f"FAILED {root}:\n{log}")
+            else:
+                print(f"{root}: {len(stale)} outputs rebuilt in {seconds * 1000:.0f} ms")
+    elapsed = time.perf_counter() - start
+    rate = len(sites) / elapsed * 60 if elapsed else 0
+    print(f"Built {len(sites) - failed} of {len(sites)} sites in {elapsed:.2f}s ({rate:.0f} sites/min)")
+    if failed:
+        raise SystemExit(1)
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Compile index-dynamic.html and data/ into index.html, sitemap.xml and llms.txt.')
+    parser.add_argument('--force', action='store_true', help='ignore the build manifest and rebuild every output')
+    parser.add_argument('-j', '--jobs', type=int, default=1, help='render cards in N worker processes, or build N sites at once with --batch (0 = one per CPU)')
+    parser.add_argument('--output-style', choices=['pretty', 'compact'], default='pretty',
+                        help='pretty keeps the template indentation, compact strips comments and indentation')
+    parser.add_argument('--lazy-details', action='store_true',
+                        help='write detail documents to details/build/ instead of embedding them in index.html')
+    parser.add_argument('--responsive-images', action='store_true',
+                        help='generate width variants of the page images and write srcset/sizes (needs Pillow)')
+    parser.add_argument('--static-pages', action='store_true',
+                        help='also write a page per paginated section page and per project, research item and achievement')
+    parser.add_argument('--fingerprint', action='store_true',
+                        help='copy CSS, JS and images to content-hashed names under assets/ and write _headers')
+    parser.add_argument('--critical-css', action='store_true',
+                        help='inline the CSS the first screen needs and load the rest of the stylesheet without blocking')
+    parser.add_argument('--bundle', action='store_true',
+                        help='minify and bundle the scripts and stylesheet with source maps, and embed the data in index.html')
+    parser.add_argument('--archive', action='store_true',
+                        help='index archive.zip in archive/manifest.json and extract the archived sites it can serve')
+    parser.add_argument('--budget', nargs='?', const='budgets.json', metavar='CONFIG',
+                        help='measure page weight and DOM size, fail when over the limits in CONFIG (default budgets.json)')
+    parser.add_argument('--compress', action='store_true',
+                        help='write .gz (and .br, if brotli is installed) copies of every text artifact')
+    parser.add_argument('--timings', metavar='PATH', help='write per-phase wall times as JSON')
+    parser.add_argument('--profile', metavar='PATH',
+                        help='write a Chrome trace / Perfetto JSON of every phase and card, and print the slowest ones')
+    parser.add_argument('--profile-top', type=int, default=15, metavar='N', help='entries per list in the --profile summary')
+    parser.add_argument('--cprofile-dir', metavar='DIR', help='dump a cProfile .prof file per top-level phase')
+    parser.add_argument('--watch', action='store_true',
+                        help='rebuild on every change and serve the site with live reload')
+    parser.add_argument('--batch', metavar='SITES.json',
+                        help='build every site listed in SITES.json, sharing one template and markdown cache')
+    parser.add_argument('--host', default='127.0.0.1', help='address for --watch to serve on')
+    parser.add_argument('--port', type=int, default=8000, help='port for --watch to serve on')
+    args = parser.parse_args()
+    render_options['lazy_details'] = args.lazy_details
+
+    try:
+        if args.batch:
+            batch(args)
+        elif args.watch:
+            watch(args)
+        else:
+            build(args, {})
+    except DataError as e:
+        print(f"Invalid data:\n{e}")
+        raise SystemExit(1)
+    except BudgetError as e:
+        print(f"Budget exceeded:\n{e}")
+        raise SystemExit(1)
+
+
+if __name__ == '__main__':
+    main()
@@ -8,14 +8,38 @@ class Portfolio {
             certifications: 1
         };
         this.allData = {};
+        this.searchIndex = null;
+        this.detailFragments = this.collectDetailFragments();
         this.init();
     }
 
+    // Remember the prerendered detail fragments referenced by the compiled
+    // page (compile.py --lazy-details) before the cards are re-rendered
+    collectDetailFragments() {
+        const fragments = {};
+        document.querySelectorAll('.card .expand-btn[data-detail-src]').forEach(button => {
+            const card = button.closest('.card');
+            if (card && card.id) {
+                fragments[card.id] = button.dataset.detailSrc;
+            }
+        });
+        return fragments;
+    }
+
     async init() {
+        // Pages written by compile.py --static-pages are complete; they only
+        // need the navigation and the card buttons wired up
+        if (document.body.hasAttribute('data-static-page')) {
+            this.setupNavigation();
+            this.setupStaticCards();
+            return;
+        }
+
         await this.loadAllData();
         this.setupNavigation();
         this.setupSmoothScrolling();
         this.setupContactForm();
+        this.setupSearch();
         this.renderAllSections();
     }
 
@@ -43,15 +67,24 @@ class Portfolio {
         // Show loading state initially
         this.showSkeletonLoaders();
 
-        // Fetch all JSON files in parallel
-        const results = await Promise.all(
-            dataFiles.map(file => this.fetchJSON(`data/${file}.json`))
-        );
-
-        // Assign results back into this.allData
-        dataFiles.forEach((file, i) => {
-            this.allData[file] = results[i];
-        });
+        // Pages built by compile.py --bundle carry the data inline; the
+        // bundler drops the fetch path between the markers below
+        const prerendered = document.getElementById('portfolio-data');
+        if (prerendered) {
+            Object.assign(this.allData, JSON.parse(prerendered.textContent));
+        } else {
+            // @bundle-strip-start
+            // Fetch all JSON files in parallel
+            const results = await Promise.all(
+                dataFiles.map(file => this.fetchJSON(`data/${file}.json`))
+            );
+
+            // Assign results back into this.allData
+            dataFiles.forEach((file, i) => {
+                this.allData[file] = results[i];
+            });
+            // @bundle-strip-end
+        }
 
         // Set profile URLs in config from about.json
         if (this.allData.about?.socials) {
@@ -144,10 +177,11 @@ class Portfolio {
         const navLinks = document.querySelectorAll('.nav-links a');
         navLinks.forEach(link => {
             link.addEventListener('click', (e) => {
-                e.preventDefault();
                 const targetId = link.getAttribute('href').substring(1);
                 const targetSection = document.getElementById(targetId);
+                // Sections missing from this page (static pages) navigate normally
                 if (targetSection) {
+                    e.preventDefault();
                     smoothScrollTo(targetSection);
                 }
             });
@@ -157,10 +191,10 @@ class Portfolio {
         const mobileNavLinks = document.querySelectorAll('.mobile-nav-link');
         mobileNavLinks.forEach(link => {
             link.addEventListener('click', (e) => {
-                e.preventDefault();
                 const targetId = link.getAttribute('href').substring(1);
                 const targetSection = document.getElementById(targetId);
                 if (targetSection) {
+                    e.preventDefault();
                     smoothScrollTo(targetSection);
                     // Close mobile menu after navigation
                     this.closeMobileMenu();
@@ -191,6 +225,20 @@ class Portfolio {
         }
     }
 
+    // Copy-link and detail buttons of the prerendered cards on static pages
+    setupStaticCards() {
+        document.addEventListener('click', (e) => {
+            const button = e.target.closest('.card .copy-link, .card .expand-btn');
+            if (!button) return;
+            const card = button.closest('.card');
+            if (button.classList.contains('copy-link')) {
+                this.copyLink(card.id);
+            } else {
+                this.toggleDetails(card, null, button);
+            }
+        });
+    }
+
     // Setup enhanced smooth scrolling for the entire website
     setupSmoothScrolling() {
         // Enhanced smooth scroll function with better offset calculation
@@ -1018,14 +1066,21 @@ class Portfolio {
         }
 
         button.textContent = 'Loading...';
+
+        // Prefer the prerendered fragment, fall back to the raw markdown
+        const fragmentPath = this.detailFragments[card.id];
         
         try {
-            const response = await fetch(detailPath);
+            const response = await fetch(fragmentPath || detailPath);
             if (response.ok) {
-                const markdown = await response.text();
+                const content = await response.text();
                 const detailDiv = document.createElement('div');
                 detailDiv.className = 'detail-content';
-                detailDiv.innerHTML = this.renderMarkdown(markdown);
+                if (fragmentPath) {
+                    detailDiv.innerHTML = typeof DOMPurify !== 'undefined' ? DOMPurify.sanitize(content) : content;
+                } else {
+                    detailDiv.innerHTML = this.renderMarkdown(content);
+                }
                 card.appendChild(detailDiv);
                 button.textContent = 'Hide Details';
             } else {
@@ -1094,6 +1149,191 @@ class Portfolio {
         }
     }
 
+    // Search over the prebuilt inverted index (search-index.json, written
+    // by compile.py). The index is only fetched once the search box is used.
+    setupSearch() {
+        const input = document.getElementById('search-input');
+        const results = document.getElementById('search-results');
+        if (!input || !results) return;
+
+        let pending = 0;
+        const runSearch = async () => {
+            const query = input.value;
+            const request = ++pending;
+            const index = await this.loadSearchIndex();
+            if (request !== pending) return;
+            this.renderSearchResults(results, index, query);
+        };
+
+        input.addEventListener('focus', () => this.loadSearchIndex(), { once: true });
+        input.addEventListener('input', runSearch);
+        input.addEventListener('keydown', (e) => {
+            if (e.key === 'Escape') {
+                input.value = '';
+                results.hidden = true;
+            }
+        });
+        document.addEventListener('click', (e) => {
+            if (!e.target.closest('#site-search')) {
+                results.hidden = true;
+            }
+        });
+    }
+
+    loadSearchIndex() {
+        if (!this.searchIndex) {
+            this.searchIndex = this.fetchJSON('search-index.json');
+        }
+        return this.searchIndex;
+    }
+
+    // Must match search_tokens() in compile.py
+    tokenize(text) {
+        const stopwords = Portfolio.SEARCH_STOPWORDS;
+        return (text.toLowerCase().match(/[\p{L}\p{N}]+/gu) || [])
+            .filter(token => token.length > 1 && !stopwords.has(token));
+    }
+
+    // First index in terms[lo, hi) whose term is >= value
+    lowerBound(terms, value, lo, hi) {
+        while (lo < hi) {
+            const mid = (lo + hi) >> 1;
+            if (terms[mid] < value) {
+                lo = mid + 1;
+            } else {
+                hi = mid;
+            }
+        }
+        return lo;
+    }
+
+    // Term indexes matching a query token: the exact term, or every term
+    // starting with it when the token is still being typed
+    matchTerms(index, token, isPrefix) {
+        const range = index.prefixes[token.slice(0, 2)];
+        if (!range) return [];
+        const [start, end] = range;
+        const first = this.lowerBound(index.terms, token, start, end);
+        if (!isPrefix) {
+            return index.terms[first] === token ? [first] : [];
+        }
+        const matches = [];
+        for (let i = first; i < end && matches.length < 50 && index.terms[i].startsWith(token); i++) {
+            matches.push(i);
+        }
+        return matches;
+    }
+
+    // Doc -> score for one query token, decoding the delta-encoded postings
+    scoreToken(index, token, isPrefix) {
+        const scores = new Map();
+        this.matchTerms(index, token, isPrefix).forEach(termIdx => {
+            const postings = index.postings[termIdx];
+            let doc = 0;
+            for (let i = 0; i < postings.length; i += 2) {
+                doc += postings[i];
+                scores.set(doc, (scores.get(doc) || 0) + postings[i + 1]);
+            }
+        });
+        return scores;
+    }
+
+    // Cards containing every query token, best first
+    search(index, query, limit = 8) {
+        const tokens = this.tokenize(query);
+        if (tokens.length === 0) return [];
+        const lastIsPrefix = !/\s$/.test(query);
+
+        const perToken = tokens.map((token, i) => this.scoreToken(index, token, lastIsPrefix && i === tokens.length - 1));
+        perToken.sort((a, b) => a.size - b.size);
+
+        const totals = new Map(perToken[0]);
+        perToken.slice(1).forEach(scores => {
+            totals.forEach((score, doc) => {
+                if (scores.has(doc)) {
+                    totals.set(doc, score + scores.get(doc));
+                } else {
+                    totals.delete(doc);
+                }
+            });
+        });
+
+        return [...totals.entries()]
+            .sort((a, b) => b[1] - a[1] || a[0] - b[0])
+            .slice(0, limit)
+            .map(([doc]) => index.docs[doc]);
+    }
+
+    renderSearchResults(container, index, query) {
+        container.innerHTML = '';
+        if (!query.trim()) {
+            container.hidden = true;
+            return;
+        }
+        container.hidden = false;
+
+        if (!index) {
+            const item = document.createElement('li');
+            item.className = 'search-empty';
+            item.textContent = 'Search is unavailable';
+            container.appendChild(item);
+            return;
+        }
+
+        const results = this.search(index, query);
+        if (results.length === 0) {
+            const item = document.createElement('li');
+            item.className = 'search-empty';
+            item.textContent = 'No results';
+            container.appendChild(item);
+            return;
+        }
+
+        results.forEach(([section, id, title]) => {
+            const item = document.createElement('li');
+            const link = document.createElement('a');
+            link.href = `#${id}`;
+
+            const label = document.createElement('span');
+            label.className = 'search-section';
+            label.textContent = section.charAt(0).toUpperCase() + section.slice(1);
+
+            link.appendChild(label);
+            link.appendChild(document.createTextNode(title));
+            link.onclick = (e) => {
+                e.preventDefault();
+                container.hidden = true;
+                this.showSearchResult(section, id);
+            };
+            item.appendChild(link);
+            container.appendChild(item);
+        });
+    }
+
+    // Switch the section to the page holding the card, then scroll to it
+    showSearchResult(section, id) {
+        const items = this.allData[section] || [];
+        const position = items.findIndex(item => item.id === id);
+        if (position >= 0) {
+            this.currentPage[section] = Math.floor(position / config.itemsPerPage) + 1;
+            const renderers = {
+                projects: () => this.renderProjects(),
+                research: () => this.renderResearch(),
+                achievements: () => this.renderAchievements(),
+                certifications: () => this.renderCertifications()
+            };
+            renderers[section]();
+        }
+
+        const card = document.getElementById(id);
+        if (card) {
+            const cardTop = card.getBoundingClientRect().top + window.scrollY - 100; // offset for the fixed navbar
+            window.scrollTo({ top: cardTop, behavior: 'smooth' });
+            card.classList.add('search-highlight');
+            setTimeout(() => card.classList.remove('search-highlight'), 2000);
+        }
+    }
+
     // Render footer
     renderFooter() {
         const data = this.allData.about;
@@ -1228,6 +1468,11 @@ class Portfolio {
     }
 }
 
+// Must match SEARCH_STOPWORDS in compile.py
+Portfolio.SEARCH_STOPWORDS = new Set(
+    'an and are as at be by for from has in into is it of on or that the this to was were with'.split(' ')
+);
+
 // Initialize the portfolio when DOM is loaded
 document.addEventListener('DOMContentLoaded', () => {
     new Portfolio();